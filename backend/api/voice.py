@@ -6,10 +6,9 @@ from typing import Any
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 
-from backend.services.voice_service import VoiceService
+from backend.services.voice_service import get_voice_service
 
 router = APIRouter()
-voice_service = VoiceService()
 
 
 @router.post("/transcribe")
@@ -27,7 +26,7 @@ async def transcribe_audio(
 
         # Process audio
         audio_data = open(temp_path, 'rb').read()
-        return await voice_service.transcribe_audio(audio_data)
+        return await get_voice_service().transcribe_audio(audio_data)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -51,7 +50,7 @@ async def transcribe_legal_dictation(
 
         # Process with legal formatting
         audio_data = open(temp_path, 'rb').read()
-        return await voice_service.transcribe_legal_dictation(audio_data)
+        return await get_voice_service().transcribe_legal_dictation(audio_data)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -67,7 +66,7 @@ async def text_to_speech(
 ) -> StreamingResponse:
     """Convert text to speech"""
     try:
-        audio_data = await voice_service.text_to_speech(text, voice_settings={"voice": voice})
+        audio_data = await get_voice_service().text_to_speech(text, voice_settings={"voice": voice})
 
         # Convert bytes to an iterator for StreamingResponse
         async def audio_generator():
@@ -86,7 +85,7 @@ async def text_to_speech(
 async def list_available_voices() -> dict[str, Any]:
     """Get list of available TTS voices"""
     try:
-        voices: list[dict[str, Any]] = await voice_service.get_available_voices()
+        voices: list[dict[str, Any]] = await get_voice_service().get_available_voices()
         return {
             "success": True,
             "voices": voices,
@@ -47,7 +47,13 @@ class Settings(BaseSettings):
     )
     redis_url: str = "redis://localhost:6379/0"
     db_pool_size: int = 10
+    db_pool_min_size: int = 5  # Connections opened at startup by init_db and DatabaseSessionManager
     db_max_overflow: int = 20
+    db_pool_recycle: int = 300  # Seconds before a pooled connection is replaced (instead of pinging on checkout)
+    db_command_timeout: float = 30.0  # asyncpg per-statement timeout in seconds
+    db_pool_use_lifo: bool = True  # Reuse the most recent connection so idle ones age out and hot ones stay warm
+    db_statement_cache_size: int = 1024  # Prepared statements kept per connection (asyncpg and SQLAlchemy caches)
+    db_application_name: str = "solicitor-brain"  # Shown in pg_stat_activity
 
     # ChromaDB
     chroma_host: str = "localhost"
@@ -67,10 +73,17 @@ class Settings(BaseSettings):
     quarantine_path: str = "./quarantine"
 
     # Monitoring
+    metrics_enabled: bool = True  # When False, @timed leaves functions unwrapped
     prometheus_port: int = 9090
     grafana_port: int = 3001
     alertmanager_port: int = 9093
 
+    # OCR
+    ocr_max_workers: int = 4  # Worker processes for page-level OCR
+
+    # Voice
+    voice_cache_enabled: bool = False  # Keep recent transcripts and TTS audio in memory (holds dictated content)
+
     # GPU Settings
     gpu_memory_fraction: float = 0.8
     gpu_idle_fraction: float = 0.6
@@ -80,6 +93,7 @@ class Settings(BaseSettings):
     min_citation_confidence: float = 0.95
     hallucination_check: bool = True
     audit_log_retention_days: int = 2555  # 7 years
+    audit_hash_algorithm: str = "blake3"  # "sha256" where required; blake3 falls back to sha256 if not installed
 
     # Banner message
     compliance_banner: str = "AI outputs are organisational assistance only – verify before use."
@@ -18,7 +18,7 @@ from backend.services.document_scanner import DocumentScanner
 from backend.services.evidence_scanner import EvidenceScanner
 from backend.services.ocr_service import OCRService
 from backend.services.templates_service import TemplatesService
-from backend.services.voice_service import VoiceService
+from backend.services.voice_service import get_voice_service
 
 # Import database utilities
 from backend.utils.app_mode import get_database_module
@@ -45,7 +45,6 @@ class ElectronBridge:
         self.fact_service: FactService
         self.templates_service: TemplatesService
         self.ocr_service: OCRService
-        self.voice_service: VoiceService
         self.case_analyzer: CaseAnalyzer
         self.document_scanner: DocumentScanner
         self.evidence_scanner: EvidenceScanner
@@ -60,7 +59,6 @@ class ElectronBridge:
             self.fact_service = None  # type: ignore
             self.templates_service = TemplatesService()
             self.ocr_service = OCRService()
-            self.voice_service = VoiceService()
             self.case_analyzer = CaseAnalyzer()
             self.document_scanner = DocumentScanner()
             self.evidence_scanner = EvidenceScanner()
@@ -402,7 +400,7 @@ class ElectronBridge:
     async def handle_voice_operation(self, method: str, args: dict[str, Any]) -> dict[str, Any]:
         """Handle voice operations"""
         try:
-            voice_service = self.voice_service
+            voice_service = get_voice_service()
 
             if method == 'transcribe':
                 # Read audio file and transcribe
@@ -410,10 +408,17 @@ class ElectronBridge:
                     audio_data = f.read()
                 result = await voice_service.transcribe_audio(
                     audio_data,
-                    args.get('format', 'wav')
+                    args.get('format', 'wav'),
+                    skip_ambient=args.get('skip_ambient', False)
                 )
                 return self._success_response(result)
 
+            if method == 'calibrate':
+                with open(args['audio_path'], 'rb') as f:
+                    audio_data = f.read()
+                energy_threshold = await voice_service.calibrate(audio_data)
+                return self._success_response({'energy_threshold': energy_threshold})
+
             if method == 'synthesize':
                 audio_data = await voice_service.text_to_speech(
                     args['text'],
@@ -636,4 +641,9 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
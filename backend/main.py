@@ -32,6 +32,8 @@ from backend.config import settings
 from backend.middleware.error_reporting import ErrorReportingMiddleware
 from backend.utils.app_mode import get_database_module
 from backend.utils.bug_reporter import bug_reporter
+from backend.utils.compliance import close_audit_log
+from backend.utils.process_pool import get_process_pool, shutdown_process_pool
 
 # Get the appropriate database module based on environment
 db = get_database_module()
@@ -47,9 +49,12 @@ async def lifespan(_: FastAPI):
     # Startup
     logger.info("Starting Solicitor Brain API...")
     await init_db()
+    get_process_pool()
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await close_audit_log()
+    shutdown_process_pool()
 
 
 app = FastAPI(title="Solicitor Brain API", version="0.1.0", lifespan=lifespan)
@@ -16,6 +16,7 @@ import backend.models.case_facts  # noqa: F401  # type: ignore[import]
 import backend.models.document  # noqa: F401  # type: ignore[import]
 import backend.models.folder  # noqa: F401  # type: ignore[import]
 import backend.models.user  # noqa: F401  # type: ignore[import]
+import backend.services.fact_service  # noqa: F401  # registers the case_facts composite indexes
 from backend.utils.database import Base, engine
 
 logging.basicConfig(level=logging.INFO)
@@ -189,8 +189,12 @@ def create_sample_emails(cases: list[dict[str, Any]]) -> tuple[list[dict[str, An
 def create_sample_metrics(cases: list[dict[str, Any]], documents: list[dict[str, Any]], _emails: list[dict[str, Any]]) -> dict[str, Any]:  # Emails for future use
     """Create dashboard metrics"""
 
-    active_cases = len([c for c in cases if c["status"] == "active"])
-    pending_deadlines = len([c for c in cases if c.get("nextHearing")])
+    # One pass over the cases for both counts, without building intermediate lists
+    active_cases = 0
+    pending_deadlines = 0
+    for c in cases:
+        active_cases += c["status"] == "active"
+        pending_deadlines += bool(c.get("nextHearing"))
 
     return {
         "total_cases": len(cases),
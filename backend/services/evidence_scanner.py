@@ -1,8 +1,13 @@
 """
 Evidence Scanner - Professional evidence analysis and classification
 """
+import asyncio
+import functools
+import heapq
 import io
 import re
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
 from datetime import UTC, datetime
 from email.parser import Parser
 from pathlib import Path
@@ -13,7 +18,46 @@ import fitz  # type: ignore[import-untyped]  # PyMuPDF for PDF processing
 import pytesseract  # type: ignore[import-untyped]
 from PIL import Image
 
+from backend.config import settings
 from backend.models.document import Document, DocumentType
+from backend.services.ocr_service import OCRImage, ocr_image_batch
+from backend.utils.process_pool import get_process_pool
+
+try:
+    import ahocorasick  # type: ignore[import-untyped]
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+
+# Resolution used when rasterising image-only PDF pages for OCR
+OCR_RENDER_DPI = 150
+
+# Upper bound on the text run through the regex/keyword pipeline per document
+MAX_SCAN_CHARS = 256 * 1024
+
+
+async def _iterate_results(
+    results: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate scan results from either a plain or an async iterable"""
+    if isinstance(results, AsyncIterable):
+        async for result in results:
+            yield result
+    else:
+        for result in results:
+            yield result
+
+
+@functools.cache
+def _relevance_automaton() -> Any:
+    """Aho-Corasick automaton over EvidenceScanner.RELEVANCE_KEYWORDS, built once per process"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()  # type: ignore[union-attr]
+    for label, keywords in EvidenceScanner.RELEVANCE_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, label)
+    automaton.make_automaton()
+    return automaton
 
 
 class EvidenceType:
@@ -100,6 +144,18 @@ class EvidenceScanner:
         ],
     }
 
+    # Any-match regex per evidence type, used to confirm a metadata classification
+    EVIDENCE_REGEXES = {
+        evidence_type: re.compile("|".join(patterns)) for evidence_type, patterns in EVIDENCE_PATTERNS.items()
+    }
+
+    # Document types whose metadata tag maps directly onto an evidence type
+    METADATA_EVIDENCE_TYPES = {
+        DocumentType.CONTRACT.value: EvidenceType.CONTRACT,
+        DocumentType.COURT_FILING.value: EvidenceType.COURT_DOCUMENT,
+        DocumentType.CORRESPONDENCE.value: EvidenceType.CORRESPONDENCE,
+    }
+
     # Legal significance indicators
     SIGNIFICANCE_KEYWORDS = {
         "high": [
@@ -127,6 +183,27 @@ class EvidenceScanner:
         "low": ["information", "update", "notice", "acknowledgment"],
     }
 
+    # Relevance keywords by label: the common legal issues, then admissions and denials
+    RELEVANCE_KEYWORDS = {
+        "breach_of_contract": ["breach", "failed to", "did not", "violation", "default"],
+        "negligence": ["negligent", "duty of care", "reasonable care", "foreseeable"],
+        "damages": ["loss", "damage", "compensation", "costs", "expenses"],
+        "liability": ["liable", "responsible", "fault", "causation"],
+        "admission": ["acknowledge", "admit", "accept", "agree that", "concede"],
+        "denial": ["deny", "dispute", "disagree", "reject", "unfounded"],
+    }
+    ISSUE_LABELS = ("breach_of_contract", "negligence", "damages", "liability")
+
+    # Contract key terms: (keyword, description)
+    CONTRACT_KEY_TERMS = (
+        ("warranty", "Contains warranties"),
+        ("indemnity", "Contains indemnities"),
+        ("confidential", "Contains confidentiality clause"),
+    )
+
+    # Contract parties: bounded lazy groups plus a lookahead keep backtracking linear
+    PARTY_PATTERN = re.compile(r"between\s+([^,]{1,200}?)\s+and\s+([^,]{1,200}?)(?=\s+\(|,)", re.IGNORECASE)
+
     def __init__(self):
         self.ocr_available = self._check_ocr_availability()
 
@@ -138,11 +215,44 @@ class EvidenceScanner:
         except Exception:
             return False
 
-    async def scan_document(self, document_path: Path, document: Document) -> dict[str, Any]:
-        """Comprehensive document scanning and analysis"""
+    async def scan_document(
+        self, document_path: Path, document: Document, skip_ocr: bool = False, scan_date: str | None = None
+    ) -> dict[str, Any]:
+        """Comprehensive document scanning and analysis
+
+        Extraction and analysis run on the shared process pool so a slow scan
+        never blocks the event loop. Pass ``skip_ocr`` when only embedded text
+        is wanted; image-only pages are then never rasterised. Batch callers
+        can pass one ``scan_date`` timestamp for every document in the batch.
+        """
+        file_type = document_path.suffix.lower()
+        extracted_text, pdf_meta = await self._extract_text(document_path, file_type, skip_ocr)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_process_pool(),
+            self._analyze_document,
+            document_path,
+            str(document.id),
+            document.document_type.value,
+            extracted_text,
+            pdf_meta,
+            scan_date or datetime.now(UTC).isoformat(),
+        )
+
+    def _analyze_document(
+        self,
+        document_path: Path,
+        document_id: str,
+        document_type: str,
+        extracted_text: str,
+        pdf_meta: dict[str, Any],
+        scan_date: str,
+    ) -> dict[str, Any]:
+        """Run the classification and analysis pipeline over extracted text"""
         scan_result: dict[str, Any] = {
-            "document_id": str(document.id),
-            "scan_date": datetime.now(UTC).isoformat(),
+            "document_id": document_id,
+            "scan_date": scan_date,
             "file_type": document_path.suffix.lower(),
             "evidence_type": None,
             "significance": "low",
@@ -152,117 +262,181 @@ class EvidenceScanner:
             "authenticity_check": {},
             "chain_of_custody": [],
             "admissibility_issues": [],
+            "pdf_metadata": pdf_meta,
         }
-
-        # Extract text based on file type
-        file_type = scan_result["file_type"]
-        extracted_text = await self._extract_text(document_path, file_type)
         scan_result["extracted_text_preview"] = extracted_text[:500] if extracted_text else ""
 
+        # Bound regex cost on very large documents; evidence markers cluster near the start
+        scan_text = extracted_text[:MAX_SCAN_CHARS]
+        scan_result["text_truncated"] = len(extracted_text) > MAX_SCAN_CHARS
+        # Case-folded once and shared by every keyword check below
+        scan_text_lower = scan_text.lower()
+
         # Classify evidence type
-        scan_result["evidence_type"] = self._classify_evidence(extracted_text, document)
+        scan_result["evidence_type"] = self._classify_evidence(scan_text_lower, document_type)
 
         # Extract key information
-        scan_result["key_information"] = self._extract_key_info(extracted_text)
+        scan_result["key_information"] = self._extract_key_info(scan_text)
 
         # Assess legal significance
-        scan_result["significance"] = self._assess_significance(extracted_text)
+        scan_result["significance"] = self._assess_significance(scan_text_lower)
 
         # Check authenticity markers
-        scan_result["authenticity_check"] = self._check_authenticity(document_path, extracted_text)
+        scan_result["authenticity_check"] = self._check_authenticity(document_path, scan_text, pdf_meta)
 
         # Identify admissibility issues
         scan_result["admissibility_issues"] = self._check_admissibility(scan_result)
 
         # Extract structured data
         evidence_type = scan_result["evidence_type"]
-        scan_result["extracted_data"] = self._extract_structured_data(extracted_text, evidence_type)
+        scan_result["extracted_data"] = self._extract_structured_data(scan_text, scan_text_lower, evidence_type)
 
         # Legal relevance assessment
-        scan_result["legal_relevance"] = self._assess_legal_relevance(extracted_text, evidence_type)
+        scan_result["legal_relevance"] = self._assess_legal_relevance(scan_text_lower, evidence_type)
 
         return scan_result
 
-    async def _extract_text(self, file_path: Path, file_type: str) -> str:
-        """Extract text from various file formats"""
+    async def _extract_text(
+        self, file_path: Path, file_type: str, skip_ocr: bool = False
+    ) -> tuple[str, dict[str, Any]]:
+        """Extract text from various file formats, plus PDF metadata for PDFs"""
         try:
             if file_type == ".pdf":
-                return self._extract_pdf_text(file_path)
-            if file_type in [".doc", ".docx"]:
-                return self._extract_word_text(file_path)
+                return await self._extract_pdf_text(file_path, skip_ocr)
             if file_type in [".jpg", ".jpeg", ".png", ".tiff"]:
-                return self._extract_image_text(file_path)
-            if file_type == ".eml":
-                return self._extract_email_text(file_path)
-            if file_type in [".txt", ".rtf"]:
-                return file_path.read_text(encoding="utf-8", errors="ignore")
-            return ""
-        except Exception:
-            return ""
+                return ("" if skip_ocr else await self._extract_image_text(file_path)), {}
 
-    def _extract_pdf_text(self, file_path: Path) -> str:
-        """Extract text from PDF with metadata"""
-        text: list[str] = []
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(get_process_pool(), self._extract_file_text, file_path, file_type)
+            return text, {}
+        except Exception:
+            return "", {}
+
+    def _extract_file_text(self, file_path: Path, file_type: str) -> str:
+        """Extract text from formats that need no OCR (runs in a worker process)"""
+        if file_type in [".doc", ".docx"]:
+            return self._extract_word_text(file_path)
+        if file_type == ".eml":
+            return self._extract_email_text(file_path)
+        if file_type in [".txt", ".rtf"]:
+            # Only the head is ever analysed; UTF-8 needs at most 4 bytes per character
+            with file_path.open("rb") as f:
+                return f.read(MAX_SCAN_CHARS * 4).decode("utf-8", errors="ignore")
+        return ""
+
+    async def _extract_pdf_text(self, file_path: Path, skip_ocr: bool = False) -> tuple[str, dict[str, Any]]:
+        """Extract text and authenticity metadata from PDF, OCRing image-only pages in parallel"""
+        loop = asyncio.get_running_loop()
+        text, ocr_pages, pdf_meta = await loop.run_in_executor(
+            get_process_pool(), self._render_pages, file_path, skip_ocr
+        )
+        if ocr_pages:
+            ocr_results = await self._ocr_pages_parallel([img_data for _, img_data in ocr_pages])
+            for (page_num, _), ocr_text in zip(ocr_pages, ocr_results, strict=True):
+                if ocr_text:
+                    text[page_num] = f"\n--- Page {page_num} (OCR) ---\n{ocr_text}"
+
+        return "\n".join(t for t in text.values() if t), pdf_meta
+
+    def _render_pages(
+        self, file_path: Path, skip_ocr: bool = False
+    ) -> tuple[dict[int, str], list[tuple[int, OCRImage]], dict[str, Any]]:
+        """Extract page text and render image-only pages for OCR
+
+        Returns text keyed by page number (0 holds the metadata header), a raw
+        grayscale render of each page that needs OCR, and the PDF metadata used
+        by the authenticity check so the file is only parsed once.
+        """
+        text: dict[int, str] = {}
+        ocr_pages: list[tuple[int, OCRImage]] = []
+        ocr_enabled = self.ocr_available and not skip_ocr
+        pdf_meta: dict[str, Any] = {}
         try:
             with fitz.open(str(file_path)) as doc:  # type: ignore
+                # Signature fields are recorded in the AcroForm SigFlags (-1 when absent)
+                pdf_meta["has_digital_signature"] = doc.get_sigflags() > 0  # type: ignore[attr-defined]
+
                 # Extract metadata
                 metadata = doc.metadata  # type: ignore[attr-defined]
                 if metadata:
-                    text.append(f"PDF Metadata: Created {metadata.get('creationDate', 'Unknown')}")  # type: ignore[union-attr]
-                    text.append(f"Author: {metadata.get('author', 'Unknown')}")  # type: ignore[union-attr]
+                    pdf_meta["creation_date"] = metadata.get("creationDate") or None  # type: ignore[union-attr]
+                    pdf_meta["modification_date"] = metadata.get("modDate") or None  # type: ignore[union-attr]
+                    pdf_meta["author"] = metadata.get("author") or None  # type: ignore[union-attr]
+                    text[0] = (
+                        f"PDF Metadata: Created {metadata.get('creationDate', 'Unknown')}\n"  # type: ignore[union-attr]
+                        f"Author: {metadata.get('author', 'Unknown')}"  # type: ignore[union-attr]
+                    )
 
                 # Extract text from each page
                 for page_num, page in enumerate(doc, 1):  # type: ignore[arg-type]
                     page_text = page.get_text()  # type: ignore[attr-defined]
                     if page_text.strip():  # type: ignore[union-attr]
-                        text.append(f"\n--- Page {page_num} ---\n{page_text}")
+                        text[page_num] = f"\n--- Page {page_num} ---\n{page_text}"
 
-                    # If no text, try OCR on the page
-                    if not page_text.strip() and self.ocr_available:  # type: ignore[union-attr]
-                        pix = page.get_pixmap()  # type: ignore[attr-defined]
-                        img_data = pix.pil_tobytes(format="PNG")  # type: ignore[attr-defined]
-                        ocr_text = self._ocr_image_bytes(img_data)  # type: ignore[arg-type]
-                        if ocr_text:
-                            text.append(f"\n--- Page {page_num} (OCR) ---\n{ocr_text}")
+                    # If no text, queue the page for OCR unless it has nothing to read
+                    elif ocr_enabled and (page.get_images() or page.get_drawings()):  # type: ignore[attr-defined]
+                        text[page_num] = ""
+                        pix = page.get_pixmap(colorspace=fitz.csGRAY, dpi=OCR_RENDER_DPI)  # type: ignore[attr-defined]
+                        ocr_pages.append((page_num, (pix.width, pix.height, pix.samples)))  # type: ignore[attr-defined]
 
         except Exception:
             pass
 
-        return "\n".join(text)
+        return text, ocr_pages, pdf_meta
+
+    async def _ocr_pages_parallel(self, images: list[OCRImage]) -> list[str]:
+        """OCR page images in contiguous batches, one batch per pool worker"""
+        if not images:
+            return []
+
+        batch_size = -(-len(images) // settings.ocr_max_workers)
+        batches = [images[i : i + batch_size] for i in range(0, len(images), batch_size)]
+
+        loop = asyncio.get_running_loop()
+        batch_results = await asyncio.gather(
+            *(loop.run_in_executor(get_process_pool(), ocr_image_batch, batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        results: list[str] = []
+        for batch, batch_result in zip(batches, batch_results, strict=True):
+            results.extend(batch_result if isinstance(batch_result, list) else [""] * len(batch))
+        return results
 
     def _extract_word_text(self, file_path: Path) -> str:
         """Extract text from Word documents"""
         try:
             doc = docx.Document(str(file_path))
-            text: list[str] = []
+            text = io.StringIO()
 
             # Extract paragraphs
             for para in doc.paragraphs:
                 if para.text.strip():
-                    text.append(para.text)
+                    text.write(para.text)
+                    text.write("\n")
 
             # Extract tables
             for table in doc.tables:
                 for row in table.rows:
                     row_text: list[str] = [cell.text.strip() for cell in row.cells]
                     if any(row_text):
-                        text.append(" | ".join(row_text))
+                        text.write(" | ".join(row_text))
+                        text.write("\n")
 
-            return "\n".join(text)
+            return text.getvalue()
         except Exception:
             return ""
 
-    def _extract_image_text(self, file_path: Path) -> str:
+    async def _extract_image_text(self, file_path: Path) -> str:
         """Extract text from images using OCR"""
         if not self.ocr_available:
             return ""
 
         try:
-            image = Image.open(file_path)  # type: ignore[no-untyped-call]
-            text_result = pytesseract.image_to_string(image)  # type: ignore[no-any-return]
-            text = str(text_result) if isinstance(text_result, str) else ""
+            (text,) = await self._ocr_pages_parallel([file_path.read_bytes()])
 
             # Also extract image metadata
+            image = Image.open(file_path)  # type: ignore[no-untyped-call]
             exif_data = image.getexif()  # type: ignore[no-untyped-call]
             if exif_data:
                 text = f"Image metadata: {exif_data}\n\n{text}"
@@ -277,12 +451,12 @@ class EvidenceScanner:
             with open(file_path, encoding="utf-8", errors="ignore") as f:
                 msg = Parser().parse(f)
 
-            text: list[str] = []
-            text.append(f"From: {msg.get('From', 'Unknown')}")
-            text.append(f"To: {msg.get('To', 'Unknown')}")
-            text.append(f"Date: {msg.get('Date', 'Unknown')}")
-            text.append(f"Subject: {msg.get('Subject', 'Unknown')}")
-            text.append("\nBody:")
+            text = io.StringIO()
+            text.write(f"From: {msg.get('From', 'Unknown')}\n")
+            text.write(f"To: {msg.get('To', 'Unknown')}\n")
+            text.write(f"Date: {msg.get('Date', 'Unknown')}\n")
+            text.write(f"Subject: {msg.get('Subject', 'Unknown')}\n")
+            text.write("\nBody:\n")
 
             # Extract body
             if msg.is_multipart():
@@ -290,71 +464,59 @@ class EvidenceScanner:
                     if part.get_content_type() == "text/plain":
                         payload = part.get_payload(decode=True)
                         if payload and isinstance(payload, bytes):
-                            text.append(payload.decode("utf-8", errors="ignore"))
+                            text.write(payload.decode("utf-8", errors="ignore"))
                         elif payload and isinstance(payload, str):
-                            text.append(payload)
+                            text.write(payload)
+                        text.write("\n")
             else:
                 payload = msg.get_payload(decode=True)
                 if payload and isinstance(payload, bytes):
-                    text.append(payload.decode("utf-8", errors="ignore"))
+                    text.write(payload.decode("utf-8", errors="ignore"))
                 elif payload and isinstance(payload, str):
-                    text.append(payload)
-
-            return "\n".join(text)
-        except Exception:
-            return ""
+                    text.write(payload)
 
-    def _ocr_image_bytes(self, image_bytes: bytes) -> str:
-        """OCR from image bytes"""
-        try:
-            image = Image.open(io.BytesIO(image_bytes))  # type: ignore[no-untyped-call]
-            result = pytesseract.image_to_string(image)  # type: ignore[no-any-return]
-            return str(result) if isinstance(result, str) else ""
+            return text.getvalue()
         except Exception:
             return ""
 
-    def _classify_evidence(self, text: str, document: Document) -> str:
+    def _classify_evidence(self, text_lower: str, document_type: str) -> str:
         """Classify evidence type using patterns and context"""
-        if not text:
+        if not text_lower:
             return EvidenceType.BUSINESS_RECORD
 
-        text_lower = text.lower()
-        scores = {}
+        # Trust the document's metadata tag when the text backs it up
+        metadata_type = self.METADATA_EVIDENCE_TYPES.get(document_type)
+        if metadata_type and self.EVIDENCE_REGEXES[metadata_type].search(text_lower):
+            return metadata_type
 
-        # Score each evidence type based on pattern matches
+        # Score each evidence type based on pattern matches and metadata, keeping the first best
+        best_type = EvidenceType.BUSINESS_RECORD
+        best_score = 0
         for evidence_type, patterns in self.EVIDENCE_PATTERNS.items():
-            score = 0
+            score = 5 if evidence_type == metadata_type else 0
             for pattern in patterns:
                 if re.search(pattern, text_lower):
                     score += 1
-            scores[evidence_type] = score
+            if score > best_score:
+                best_type, best_score = evidence_type, score
 
-        # Check document metadata
-        if document.document_type.value == DocumentType.CONTRACT.value:
-            scores[EvidenceType.CONTRACT] += 5
-        elif document.document_type.value == DocumentType.COURT_FILING.value:
-            scores[EvidenceType.COURT_DOCUMENT] += 5
-        elif document.document_type.value == DocumentType.CORRESPONDENCE.value:
-            scores[EvidenceType.CORRESPONDENCE] += 5
-
-        # Return highest scoring type
-        if scores:
-            return max(scores, key=scores.get)  # type: ignore[arg-type]
-        return EvidenceType.BUSINESS_RECORD
+        # Nothing matched: fall back to a generic business record
+        return best_type
 
     def _extract_key_info(self, text: str) -> dict[str, list[str]]:
         """Extract key information from text"""
         if not text:
             return {}
 
-        key_info: dict[str, list[str]] = {
-            "dates": [],
-            "amounts": [],
-            "names": [],
-            "addresses": [],
-            "reference_numbers": [],
-            "email_addresses": [],
-            "phone_numbers": [],
+        # Insertion-ordered sets: duplicates are dropped as matches are added
+        key_info: dict[str, dict[str, None]] = {
+            "dates": {},
+            "amounts": {},
+            "names": {},
+            "addresses": {},
+            "reference_numbers": {},
+            "email_addresses": {},
+            "phone_numbers": {},
         }
 
         # Date patterns (UK format)
@@ -366,15 +528,15 @@ class EvidenceScanner:
 
         for pattern in date_patterns:
             matches = re.findall(pattern, text, re.IGNORECASE)
-            key_info["dates"].extend(matches)
+            key_info["dates"].update(dict.fromkeys(matches))
 
         # Amounts (UK currency)
         amount_pattern = r"£[\d,]+(?:\.\d{2})?"
-        key_info["amounts"] = re.findall(amount_pattern, text)
+        key_info["amounts"].update(dict.fromkeys(re.findall(amount_pattern, text)))
 
         # Email addresses
         email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        key_info["email_addresses"] = re.findall(email_pattern, text)
+        key_info["email_addresses"].update(dict.fromkeys(re.findall(email_pattern, text)))
 
         # Phone numbers (UK format)
         phone_patterns = [
@@ -385,7 +547,7 @@ class EvidenceScanner:
 
         for pattern in phone_patterns:
             matches = re.findall(pattern, text)
-            key_info["phone_numbers"].extend(matches)
+            key_info["phone_numbers"].update(dict.fromkeys(matches))
 
         # Reference numbers (case numbers, invoice numbers, etc.)
         ref_patterns = [
@@ -395,37 +557,39 @@ class EvidenceScanner:
 
         for pattern in ref_patterns:
             matches = re.findall(pattern, text, re.IGNORECASE)
-            key_info["reference_numbers"].extend(matches)
+            key_info["reference_numbers"].update(dict.fromkeys(matches))
 
         # Names (basic extraction - would use NER in production)
         # Look for patterns like "Mr/Mrs/Ms/Dr Name"
         name_pattern = r"\b(?:Mr|Mrs|Ms|Dr|Prof)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b"
-        key_info["names"] = re.findall(name_pattern, text)
-
-        # Remove duplicates
-        for key in key_info:
-            key_info[key] = list(set(key_info[key]))
+        key_info["names"].update(dict.fromkeys(re.findall(name_pattern, text)))
 
-        return key_info
+        return {key: list(values) for key, values in key_info.items()}
 
-    def _assess_significance(self, text: str) -> str:
+    def _assess_significance(self, text_lower: str) -> str:
         """Assess legal significance of the evidence"""
-        if not text:
+        if not text_lower:
             return "low"
 
-        text_lower = text.lower()
-
-        # Count significance indicators
-        high_count = sum(1 for keyword in self.SIGNIFICANCE_KEYWORDS["high"] if keyword in text_lower)
-        medium_count = sum(1 for keyword in self.SIGNIFICANCE_KEYWORDS["medium"] if keyword in text_lower)
-
-        if high_count >= 3:
-            return "high"
-        if high_count >= 1 or medium_count >= 3:
+        # Count significance indicators, stopping as soon as the outcome is decided
+        high_count = 0
+        for keyword in self.SIGNIFICANCE_KEYWORDS["high"]:
+            if keyword in text_lower:
+                high_count += 1
+                if high_count >= 3:
+                    return "high"
+        if high_count >= 1:
             return "medium"
+
+        medium_count = 0
+        for keyword in self.SIGNIFICANCE_KEYWORDS["medium"]:
+            if keyword in text_lower:
+                medium_count += 1
+                if medium_count >= 3:
+                    return "medium"
         return "low"
 
-    def _check_authenticity(self, file_path: Path, text: str) -> dict[str, Any]:
+    def _check_authenticity(self, file_path: Path, text: str, pdf_meta: dict[str, Any]) -> dict[str, Any]:
         """Check document authenticity markers"""
         authenticity: dict[str, Any] = {
             "digital_signature": False,
@@ -452,17 +616,12 @@ class EvidenceScanner:
             authenticity["metadata_intact"] = False
             authenticity["authenticity_score"] -= 30
 
-        # Check for PDF signatures
-        if file_path.suffix.lower() == ".pdf":
-            try:
-                with fitz.open(str(file_path)) as doc:  # type: ignore
-                    for page in doc:  # type: ignore
-                        if page.get_text().find("/Sig") != -1:  # type: ignore[attr-defined]
-                            authenticity["digital_signature"] = True
-                            authenticity["authenticity_score"] += 10
-                            break
-            except Exception:
-                pass
+        # Check for PDF signatures (metadata captured during text extraction)
+        if pdf_meta.get("has_digital_signature"):
+            authenticity["digital_signature"] = True
+            authenticity["authenticity_score"] += 10
+        if pdf_meta.get("author"):
+            authenticity["author"] = pdf_meta["author"]
 
         # Check for suspicious content patterns
         suspicious_patterns = [
@@ -490,15 +649,16 @@ class EvidenceScanner:
         if scan_result["authenticity_check"]["authenticity_score"] < 70:
             issues.append("Low authenticity score - may face challenge on authenticity grounds")
 
+        text_preview = scan_result.get("extracted_text_preview", "").lower()
+
         # Check for hearsay
         if scan_result["evidence_type"] in [
             EvidenceType.CORRESPONDENCE,
             EvidenceType.BUSINESS_RECORD,
-        ] and "i was told" in scan_result.get("extracted_text_preview", "").lower():
+        ] and "i was told" in text_preview:
             issues.append("Potential hearsay - consider Civil Evidence Act 1995 notice requirements")
 
         # Check for privilege
-        text_preview = scan_result.get("extracted_text_preview", "").lower()
         if "without prejudice" in text_preview:
             issues.append("Without prejudice communication - generally not admissible")
         elif "legally privileged" in text_preview or "legal advice" in text_preview:
@@ -515,29 +675,18 @@ class EvidenceScanner:
                 "instructions",
                 "statement of truth",
             ]
-            text_lower = scan_result.get("extracted_text_preview", "").lower()
-            missing: list[str] = [elem for elem in required_elements if elem not in text_lower]
+            missing: list[str] = [elem for elem in required_elements if elem not in text_preview]
             if missing:
                 issues.append(f"Expert report may be missing: {', '.join(missing)} (CPR Part 35)")
 
         return issues
 
-    def _extract_structured_data(self, text: str, evidence_type: str) -> dict[str, Any]:
+    def _extract_structured_data(self, text: str, text_lower: str, evidence_type: str) -> dict[str, Any]:
         """Extract structured data based on evidence type"""
-        structured_data = {}
-
-        if evidence_type == EvidenceType.CONTRACT:
-            structured_data = self._extract_contract_data(text)
-        elif evidence_type == EvidenceType.FINANCIAL:
-            structured_data = self._extract_financial_data(text)
-        elif evidence_type == EvidenceType.WITNESS_STATEMENT:
-            structured_data = self._extract_witness_data(text)
-        elif evidence_type == EvidenceType.CORRESPONDENCE:
-            structured_data = self._extract_correspondence_data(text)
+        extractor = self.STRUCTURED_EXTRACTORS.get(evidence_type)
+        return extractor(self, text, text_lower) if extractor else {}
 
-        return structured_data
-
-    def _extract_contract_data(self, text: str) -> dict[str, Any]:
+    def _extract_contract_data(self, text: str, text_lower: str) -> dict[str, Any]:
         """Extract contract-specific data"""
         data: dict[str, Any] = {
             "parties": [],
@@ -550,10 +699,10 @@ class EvidenceScanner:
         }
 
         # Extract parties
-        party_pattern = r"between\s+([^,]+?)\s+(?:and|AND)\s+([^,]+?)(?:\s+\(|,)"
-        matches = re.findall(party_pattern, text, re.IGNORECASE)
-        if matches:
-            data["parties"] = [party.strip() for match in matches for party in match]
+        if "between" in text_lower:
+            matches = self.PARTY_PATTERN.findall(text)
+            if matches:
+                data["parties"] = [party.strip() for match in matches for party in match]
 
         # Extract dates
         date_patterns = {
@@ -573,16 +722,11 @@ class EvidenceScanner:
             data["consideration"] = match.group(1)
 
         # Key terms (simplified)
-        if "warranty" in text.lower():
-            data["key_terms"].append("Contains warranties")
-        if "indemnity" in text.lower():
-            data["key_terms"].append("Contains indemnities")
-        if "confidential" in text.lower():
-            data["key_terms"].append("Contains confidentiality clause")
+        data["key_terms"] = [term for keyword, term in self.CONTRACT_KEY_TERMS if keyword in text_lower]
 
         return data
 
-    def _extract_financial_data(self, text: str) -> dict[str, Any]:
+    def _extract_financial_data(self, text: str, _text_lower: str) -> dict[str, Any]:
         """Extract financial document data"""
         data: dict[str, Any] = {
             "total_amount": None,
@@ -614,7 +758,7 @@ class EvidenceScanner:
 
         return data
 
-    def _extract_witness_data(self, text: str) -> dict[str, Any]:
+    def _extract_witness_data(self, text: str, text_lower: str) -> dict[str, Any]:
         """Extract witness statement data"""
         data: dict[str, Any] = {
             "witness_name": None,
@@ -630,7 +774,7 @@ class EvidenceScanner:
             data["witness_name"] = match.group(1)
 
         # Check for statement of truth
-        if "believe that the facts" in text.lower() and "true" in text.lower():
+        if "believe that the facts" in text_lower and "true" in text_lower:
             data["statement_of_truth"] = True
 
         # Extract incident descriptions
@@ -646,7 +790,7 @@ class EvidenceScanner:
 
         return data
 
-    def _extract_correspondence_data(self, text: str) -> dict[str, Any]:
+    def _extract_correspondence_data(self, text: str, text_lower: str) -> dict[str, Any]:
         """Extract correspondence data"""
         data: dict[str, Any] = {
             "sender": None,
@@ -658,11 +802,11 @@ class EvidenceScanner:
         }
 
         # Check for without prejudice
-        if "without prejudice" in text.lower():
+        if "without prejudice" in text_lower:
             data["is_without_prejudice"] = True
 
         # Check for letter before action
-        if "letter before action" in text.lower() or "letter of claim" in text.lower():
+        if "letter before action" in text_lower or "letter of claim" in text_lower:
             data["is_letter_before_action"] = True
 
         # Extract sender/recipient
@@ -679,7 +823,26 @@ class EvidenceScanner:
 
         return data
 
-    def _assess_legal_relevance(self, text: str, evidence_type: str) -> dict[str, Any]:
+    # Structured data extractor per evidence type; other types have no structured data
+    STRUCTURED_EXTRACTORS: dict[str, Callable[["EvidenceScanner", str, str], dict[str, Any]]] = {
+        EvidenceType.CONTRACT: _extract_contract_data,
+        EvidenceType.FINANCIAL: _extract_financial_data,
+        EvidenceType.WITNESS_STATEMENT: _extract_witness_data,
+        EvidenceType.CORRESPONDENCE: _extract_correspondence_data,
+    }
+
+    def _match_relevance_keywords(self, text_lower: str) -> set[str]:
+        """Return the RELEVANCE_KEYWORDS labels with at least one keyword in the text"""
+        automaton = _relevance_automaton()
+        if automaton is not None:
+            return {label for _, label in automaton.iter(text_lower)}
+        return {
+            label
+            for label, keywords in self.RELEVANCE_KEYWORDS.items()
+            if any(keyword in text_lower for keyword in keywords)
+        }
+
+    def _assess_legal_relevance(self, text_lower: str, evidence_type: str) -> dict[str, Any]:
         """Assess legal relevance of the evidence"""
         relevance: dict[str, Any] = {
             "relevance_score": 0,
@@ -689,55 +852,21 @@ class EvidenceScanner:
             "procedural_importance": None,
         }
 
-        text_lower = text.lower()
+        matched = self._match_relevance_keywords(text_lower)
 
         # Check relevance to common legal issues
-        issue_keywords = {
-            "breach_of_contract": [
-                "breach",
-                "failed to",
-                "did not",
-                "violation",
-                "default",
-            ],
-            "negligence": [
-                "negligent",
-                "duty of care",
-                "reasonable care",
-                "foreseeable",
-            ],
-            "damages": ["loss", "damage", "compensation", "costs", "expenses"],
-            "liability": ["liable", "responsible", "fault", "causation"],
-        }
-
-        for issue, keywords in issue_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for issue in self.ISSUE_LABELS:
+            if issue in matched:
                 relevance["relevant_to_issues"].append(issue)
                 relevance["relevance_score"] += 20
 
         # Check for admissions
-        admission_patterns: list[str] = [
-            "acknowledge",
-            "admit",
-            "accept",
-            "agree that",
-            "concede",
-        ]
-
-        if any(pattern in text_lower for pattern in admission_patterns):
+        if "admission" in matched:
             relevance["supports_claims"].append("Contains potential admissions")
             relevance["relevance_score"] += 30
 
         # Check for denials
-        denial_patterns: list[str] = [
-            "deny",
-            "dispute",
-            "disagree",
-            "reject",
-            "unfounded",
-        ]
-
-        if any(pattern in text_lower for pattern in denial_patterns):
+        if "denial" in matched:
             relevance["contradicts_claims"].append("Contains denials or disputes")
             relevance["relevance_score"] += 15
 
@@ -754,12 +883,18 @@ class EvidenceScanner:
 
         return relevance
 
-    async def generate_evidence_report(self, case_id: str, scan_results: list[dict[str, Any]]) -> dict[str, Any]:
-        """Generate comprehensive evidence report for the case"""
+    async def generate_evidence_report(
+        self, case_id: str, scan_results: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Generate comprehensive evidence report for the case
+
+        Scan results are folded one at a time, so callers can stream them
+        from an async generator instead of materialising every scan.
+        """
         report: dict[str, Any] = {
             "case_id": case_id,
             "report_date": datetime.now(UTC).isoformat(),
-            "total_documents_scanned": len(scan_results),
+            "total_documents_scanned": 0,
             "evidence_summary": {},
             "key_evidence": [],
             "missing_evidence": [],
@@ -769,25 +904,32 @@ class EvidenceScanner:
         }
 
         # Categorize evidence
-        evidence_by_type: dict[str, int] = {}
-        high_significance_docs: list[dict[str, Any]] = []
+        evidence_by_type: Counter[str] = Counter()
+        # Min-heap of (relevance_score, -position, entry) holding the top 10 key documents
+        key_evidence_heap: list[tuple[int, int, dict[str, Any]]] = []
         admissibility_issues: list[dict[str, Any]] = []
 
-        for result in scan_results:
+        async for result in _iterate_results(scan_results):
+            report["total_documents_scanned"] += 1
+
             # Count by type
             ev_type = result.get("evidence_type", "unknown")
-            evidence_by_type[ev_type] = evidence_by_type.get(ev_type, 0) + 1
+            evidence_by_type[ev_type] += 1
 
             # Identify key evidence
-            if result.get("significance") == "high" or result.get("legal_relevance", {}).get("relevance_score", 0) > 70:
-                high_significance_docs.append(
-                    {
-                        "document_id": result["document_id"],
-                        "type": ev_type,
-                        "significance": result.get("significance"),
-                        "key_points": result.get("key_information", {}),
-                    }
-                )
+            relevance_score = result.get("legal_relevance", {}).get("relevance_score", 0)
+            if result.get("significance") == "high" or relevance_score > 70:
+                entry = {
+                    "document_id": result["document_id"],
+                    "type": ev_type,
+                    "significance": result.get("significance"),
+                    "key_points": result.get("key_information", {}),
+                }
+                heap_item = (relevance_score, -report["total_documents_scanned"], entry)
+                if len(key_evidence_heap) < 10:
+                    heapq.heappush(key_evidence_heap, heap_item)
+                else:
+                    heapq.heappushpop(key_evidence_heap, heap_item)
 
             # Collect admissibility issues
             if result.get("admissibility_issues"):
@@ -795,8 +937,8 @@ class EvidenceScanner:
                     [{"document_id": result["document_id"], "issue": issue} for issue in result["admissibility_issues"]]
                 )
 
-        report["evidence_summary"] = evidence_by_type
-        report["key_evidence"] = high_significance_docs[:10]  # Top 10
+        report["evidence_summary"] = dict(evidence_by_type)
+        report["key_evidence"] = [entry for *_, entry in sorted(key_evidence_heap, reverse=True)]  # Top 10
         report["admissibility_concerns"] = admissibility_issues
 
         # Generate recommendations
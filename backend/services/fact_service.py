@@ -1,23 +1,81 @@
+import asyncio
 import logging
+import re
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from statistics import fmean
 from typing import Any, cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, select
+from sqlalchemy import ARRAY, JSON, Index, Select, and_, any_, event, insert, literal, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.config import settings
 from backend.models.case import Case
 from backend.models.case_facts import CaseFact, FactRelation
 from backend.services.monitoring import record_hallucination_block, timed
-from backend.utils.compliance import check_citation
+from backend.utils.compliance import check_citation, check_citations
+from backend.utils.db_context import copy_json
 
 logger = logging.getLogger(__name__)
 
+# Fact batches larger than this are loaded with PostgreSQL COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 100
+
+# Bulk INSERT statements built once, so their SQL cache keys are memoized across calls
+_CASE_FACT_INSERT = insert(CaseFact).returning(CaseFact, sort_by_parameter_order=True)
+_FACT_RELATION_INSERT = insert(FactRelation)
+
+
+# (fact_type, category, fact_date, fact_text) - the fact attributes conflict detection compares
+ConflictKey = tuple[str | None, str | None, datetime | None, str]
+
+# Common date formats: DD/MM/YYYY (or DD-MM-YYYY) and "DD Month YYYY"
+_DATE_PATTERN = re.compile(
+    r"(?P<numeric>\d{1,2}[/-]\d{1,2}[/-]\d{4})"
+    r"|(?P<worded>\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)"
+    r"\s+\d{4})",
+    re.IGNORECASE,
+)
+
+# Composite indexes for the hot fact queries (case listing, critical dates, relation checks).
+# Built from the mapped columns, so they attach to the case_facts table and are created by create_all.
+Index("ix_case_facts_case_type_signoff", CaseFact.case_id, CaseFact.fact_type, CaseFact.sign_off_status)
+Index(
+    "ix_case_facts_case_type_date",
+    CaseFact.case_id,
+    CaseFact.fact_type,
+    CaseFact.fact_date,
+    postgresql_where=text("sign_off_status <> 'rejected'"),
+)
+Index("ix_case_facts_case_created", CaseFact.case_id, CaseFact.created_at)
+# Conflict groups for find_conflicting_facts' self-join
+Index("ix_case_facts_case_type_category", CaseFact.case_id, CaseFact.fact_type, CaseFact.category)
+
+# Low-cardinality label columns shared by thousands of facts
+_INTERNED_LABELS = ("fact_type", "importance", "verification_status", "sign_off_status", "category")
+
+
+@event.listens_for(CaseFact, "load")
+def _intern_fact_labels(fact: CaseFact, _context: Any) -> None:
+    """Intern the label strings of loaded facts so equal labels share one object"""
+    # Write through __dict__ so the ORM does not record the swap as a change
+    state = fact.__dict__
+    for name in _INTERNED_LABELS:
+        value = state.get(name)
+        if isinstance(value, str):
+            state[name] = sys.intern(value)
+
 
 class FactService:
     """Core service for managing case facts with verification and compliance"""
 
+    # Fact types _determine_relation can link; facts of other types are never queried for relations
+    RELATABLE_FACT_TYPES = frozenset({"date", "party"})
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -41,8 +99,7 @@ class FactService:
         Save a fact with full verification and compliance checks
         """
         # Verify case exists
-        case = await self.db.get(Case, case_id)
-        if not case:
+        if not await self._case_exists(case_id):
             raise ValueError(f"Case {case_id} not found")
 
         # If AI-extracted, verify citations
@@ -53,7 +110,9 @@ class FactService:
                 raise ValueError("Facts must include valid citations from approved sources")
 
         # Create fact record
+        now = datetime.now(UTC)
         fact = CaseFact(
+            id=uuid4(),
             case_id=case_id,
             fact_type=fact_type,
             fact_text=fact_text,
@@ -62,15 +121,17 @@ class FactService:
             source_text=source_text,
             extracted_by_ai=extracted_by_ai,
             extraction_model=settings.primary_model if extracted_by_ai else None,
-            extraction_timestamp=datetime.now(UTC) if extracted_by_ai else None,
+            extraction_timestamp=now if extracted_by_ai else None,
             citations=citations,
             importance=importance,
             category=category,
             tags=tags,
             verification_status="unverified" if extracted_by_ai else "verified",
             verified_by=user_id if not extracted_by_ai else None,
-            verified_at=datetime.now(UTC) if not extracted_by_ai else None,
+            verified_at=now if not extracted_by_ai else None,
             confidence_score=self._calculate_confidence(citations) if citations else 0.0,
+            created_at=now,
+            updated_at=now,
         )
 
         # Parse date if it's a date-type fact
@@ -80,10 +141,14 @@ class FactService:
         self.db.add(fact)
 
         # Check for related/conflicting facts
-        await self._check_fact_relations(fact)
+        relation_rows = await self._check_fact_relations(fact)
+        if relation_rows:
+            await self.db.flush()
+            await self.db.execute(_FACT_RELATION_INSERT, relation_rows)
 
+        # Ids and timestamps are set client-side and any remaining server defaults come back
+        # with the INSERT's RETURNING, so the fact needs no refresh after commit
         await self.db.commit()
-        await self.db.refresh(fact)
 
         logger.info(f"Saved fact {fact.id} for case {case_id}")
         return fact
@@ -97,24 +162,20 @@ class FactService:
         amendment_reason: str | None = None,
     ) -> CaseFact:
         """Verify or dispute a fact"""
-        fact = await self.db.get(CaseFact, fact_id)
-        if not fact:
-            raise ValueError(f"Fact {fact_id} not found")
-
         if verification_status not in ["verified", "disputed"]:
             raise ValueError("Invalid verification status")
 
-        fact.verification_status = verification_status  # type: ignore[assignment]
-        fact.verified_by = user_id  # type: ignore[assignment]
-        fact.verified_at = datetime.now(UTC)  # type: ignore[assignment]
-
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {
+            "verification_status": verification_status,
+            "verified_by": user_id,
+            "verified_at": now,
+            "updated_at": now,
+        }
         if amendment_reason:
-            fact.amendment_reason = amendment_reason  # type: ignore[assignment]
-
-        await self.db.commit()
-        await self.db.refresh(fact)
+            values["amendment_reason"] = amendment_reason
 
-        return fact
+        return await self._update_fact(fact_id, values)
 
     @timed
     async def sign_off_fact(
@@ -125,24 +186,20 @@ class FactService:
         amendment_reason: str | None = None,
     ) -> CaseFact:
         """Sign off on a fact (accept/amend/reject)"""
-        fact = await self.db.get(CaseFact, fact_id)
-        if not fact:
-            raise ValueError(f"Fact {fact_id} not found")
-
         if sign_off_status not in ["accepted", "amended", "rejected"]:
             raise ValueError("Invalid sign-off status")
 
-        fact.sign_off_status = sign_off_status  # type: ignore[assignment]
-        fact.sign_off_by = user_id  # type: ignore[assignment]
-        fact.sign_off_at = datetime.now(UTC)  # type: ignore[assignment]
-
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {
+            "sign_off_status": sign_off_status,
+            "sign_off_by": user_id,
+            "sign_off_at": now,
+            "updated_at": now,
+        }
         if amendment_reason:
-            fact.amendment_reason = amendment_reason  # type: ignore[assignment]
+            values["amendment_reason"] = amendment_reason
 
-        await self.db.commit()
-        await self.db.refresh(fact)
-
-        return fact
+        return await self._update_fact(fact_id, values)
 
     @timed
     async def get_case_facts(
@@ -154,6 +211,20 @@ class FactService:
         include_rejected: bool = False,
     ) -> list[CaseFact]:
         """Get all facts for a case with filtering"""
+        query = self._case_facts_query(case_id, fact_type, verification_status, importance, include_rejected)
+        result = await self.db.execute(query)
+        facts: list[CaseFact] = list(result.scalars().all())
+        return facts
+
+    def _case_facts_query(
+        self,
+        case_id: UUID,
+        fact_type: str | None,
+        verification_status: str | None,
+        importance: str | None,
+        include_rejected: bool,
+    ) -> Select[tuple[CaseFact]]:
+        """Build the filtered, newest-first query behind get_case_facts"""
         query = select(CaseFact).where(CaseFact.case_id == case_id)
 
         if fact_type:
@@ -168,25 +239,46 @@ class FactService:
         if not include_rejected:
             query = query.where(CaseFact.sign_off_status != "rejected")
 
-        query = query.order_by(CaseFact.created_at.desc())
-
-        result = await self.db.execute(query)
-        facts: list[CaseFact] = list(result.scalars().all())
-        return facts
+        return query.order_by(CaseFact.created_at.desc())
 
     @timed
     async def find_conflicting_facts(self, case_id: UUID) -> list[tuple[CaseFact, CaseFact]]:
         """Find potentially conflicting facts in a case"""
-        facts = await self.get_case_facts(case_id)
-        conflicts: list[tuple[CaseFact, CaseFact]] = []
-
-        # Simple conflict detection - can be enhanced with NLP
-        for i, fact1 in enumerate(facts):
-            for fact2 in facts[i + 1 :]:
-                if self._facts_may_conflict(fact1, fact2):
-                    conflicts.append((fact1, fact2))
+        # Self-join facts within each conflict group (same case, type and category - see _keys_conflict)
+        # so the database pairs them through an index instead of comparing every pair in Python
+        first = aliased(CaseFact)
+        second = aliased(CaseFact)
+        query = (
+            select(first, second)
+            .join(
+                second,
+                and_(
+                    second.case_id == first.case_id,
+                    second.fact_type == first.fact_type,
+                    second.category.is_not_distinct_from(first.category),
+                    # Each pair once, oriented as get_case_facts lists them: newer fact first, id breaking ties
+                    or_(
+                        second.created_at < first.created_at,
+                        and_(second.created_at == first.created_at, second.id > first.id),
+                    ),
+                ),
+            )
+            .where(
+                first.case_id == case_id,
+                first.fact_type.in_(self.RELATABLE_FACT_TYPES),
+                first.sign_off_status != "rejected",
+                second.sign_off_status != "rejected",
+                or_(
+                    # NULL dates compare as unknown, so facts without a date never conflict
+                    and_(first.fact_type == "date", first.fact_date != second.fact_date),
+                    and_(first.fact_type == "party", first.fact_text != second.fact_text),
+                ),
+            )
+            .order_by(first.created_at.desc(), first.id, second.created_at.desc(), second.id)
+        )
 
-        return conflicts
+        result = await self.db.execute(query)
+        return [(fact1, fact2) for fact1, fact2 in result.tuples()]
 
     @timed
     async def get_critical_dates(self, case_id: UUID) -> list[CaseFact]:
@@ -212,71 +304,181 @@ class FactService:
     async def bulk_extract_facts(
         self, case_id: UUID, document_id: UUID, extracted_facts: list[dict[str, Any]]
     ) -> list[CaseFact]:
-        """Bulk save facts extracted from a document"""
-        saved_facts: list[CaseFact] = []
+        """Bulk save facts extracted from a document in a single transaction"""
+        # Validate the case once for the whole batch
+        if not await self._case_exists(case_id):
+            logger.error(f"Failed to save facts: Case {case_id} not found")
+            return []
+
+        now = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
 
+        # Each fact must have citations
+        cited_facts: list[dict[str, Any]] = []
         for fact_data in extracted_facts:
-            # Each fact must have citations
             if not fact_data.get("citations"):
                 logger.warning(f"Skipping fact without citations: {fact_data.get('text', '')[:50]}...")
                 continue
+            cited_facts.append(fact_data)
 
-            try:
-                fact = await self.save_fact(
-                    case_id=case_id,
-                    fact_text=fact_data["text"],
-                    fact_type=fact_data.get("type", "general"),
-                    source_document_id=document_id,
-                    source_page=fact_data.get("page"),
-                    source_text=fact_data.get("source_text"),
-                    citations=fact_data["citations"],
-                    extracted_by_ai=True,
-                    importance=fact_data.get("importance", "medium"),
-                    category=fact_data.get("category"),
-                    tags=fact_data.get("tags", []),
+        # Validate the whole batch's citations in one worker-thread call, off the event loop
+        if settings.citation_required:
+            checks = await asyncio.to_thread(
+                check_citations, [(fact_data["text"], fact_data["citations"]) for fact_data in cited_facts]
+            )
+        else:
+            checks = [True] * len(cited_facts)
+
+        for fact_data, citations_valid in zip(cited_facts, checks, strict=True):
+            citations = fact_data["citations"]
+            if not citations_valid:
+                logger.warning(f"Blocked fact without proper citations: {fact_data['text'][:100]}...")
+                record_hallucination_block()
+                continue
+
+            fact_type = fact_data.get("type", "general")
+            rows.append(
+                {
+                    "case_id": case_id,
+                    "fact_type": fact_type,
+                    "fact_text": fact_data["text"],
+                    "source_document_id": document_id,
+                    "source_page": fact_data.get("page"),
+                    "source_text": fact_data.get("source_text"),
+                    "extracted_by_ai": True,
+                    "extraction_model": settings.primary_model,
+                    "extraction_timestamp": now,
+                    "citations": citations,
+                    "importance": fact_data.get("importance", "medium"),
+                    "category": fact_data.get("category"),
+                    "tags": fact_data.get("tags", []),
+                    "verification_status": "unverified",
+                    "confidence_score": self._calculate_confidence(citations),
+                    "fact_date": self._extract_date(fact_data["text"]) if fact_type == "date" else None,
+                }
+            )
+
+        if not rows:
+            return []
+
+        # Cache the existing facts the batch may relate to, loaded with one query across its fact types
+        similar_by_type: dict[str, list[CaseFact]] = defaultdict(list)
+        batch_types = {row["fact_type"] for row in rows} & self.RELATABLE_FACT_TYPES
+        if batch_types:
+            existing = await self.db.scalars(
+                select(CaseFact).where(
+                    and_(
+                        CaseFact.case_id == case_id,
+                        CaseFact.fact_type.in_(batch_types),
+                        CaseFact.sign_off_status != "rejected",
+                    )
                 )
-                saved_facts.append(fact)
-            except ValueError as e:
-                logger.error(f"Failed to save fact: {e}")
+            )
+            for similar in existing:
+                similar_by_type[cast("str", similar.fact_type)].append(similar)
+
+        saved_facts = await self._insert_facts(rows)
+
+        # Relate each new fact to the cached facts, adding it to the cache for the rest of the batch
+        relation_rows: list[dict[str, Any]] = []
+        for fact in saved_facts:
+            if fact.fact_type not in batch_types:
                 continue
+            similar_facts = similar_by_type[cast("str", fact.fact_type)]
+            relation_rows.extend(self._relation_rows(fact, similar_facts))
+            similar_facts.append(fact)
+
+        if relation_rows:
+            await self.db.execute(_FACT_RELATION_INSERT, relation_rows)
+
+        await self.db.commit()
 
+        logger.info(f"Saved {len(saved_facts)} facts for case {case_id} from document {document_id}")
         return saved_facts
 
+    async def _update_fact(self, fact_id: UUID, values: dict[str, Any]) -> CaseFact:
+        """Apply an update with a single UPDATE ... RETURNING and commit it"""
+        fact = await self.db.scalar(update(CaseFact).where(CaseFact.id == fact_id).values(**values).returning(CaseFact))
+        if not fact:
+            raise ValueError(f"Fact {fact_id} not found")
+
+        await self.db.commit()
+        return fact
+
+    async def _case_exists(self, case_id: UUID) -> bool:
+        """Check a case exists without loading the full row"""
+        result = await self.db.scalar(select(Case.id).where(Case.id == case_id))
+        return result is not None
+
+    async def _insert_facts(self, rows: list[dict[str, Any]]) -> list[CaseFact]:
+        """Insert fact rows and return them in order, using COPY for large PostgreSQL batches"""
+        if len(rows) > COPY_THRESHOLD and self.db.get_bind().dialect.driver == "asyncpg":
+            return await self._bulk_copy_facts(rows)
+
+        result = await self.db.scalars(_CASE_FACT_INSERT, rows)
+        return list(result.all())
+
+    async def _bulk_copy_facts(self, rows: list[dict[str, Any]]) -> list[CaseFact]:
+        """Load fact rows with asyncpg COPY, then read them back in insertion order"""
+        table = CaseFact.__table__
+
+        # COPY bypasses the ORM, so apply client-side column defaults (including the ids) here
+        for column in table.columns:
+            default = column.default
+            if default is None or not (default.is_scalar or default.is_callable):  # type: ignore[union-attr]
+                continue
+            value = default.arg  # type: ignore[union-attr]
+            for row in rows:
+                if column.key not in row:
+                    row[column.key] = value(None) if callable(value) else value
+
+        keys = list(rows[0])
+        json_keys = {column.key for column in table.columns if isinstance(column.type, JSON)}
+        records = [tuple(copy_json(row[key]) if key in json_keys else row[key] for key in keys) for row in rows]
+
+        # Binary COPY: asyncpg sends each value in its native wire encoding rather than formatted text
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            table.name, records=records, columns=[table.c[key].name for key in keys]
+        )
+
+        ids = [row["id"] for row in rows]
+        result = await self.db.scalars(
+            select(CaseFact).where(CaseFact.id == any_(literal(ids, ARRAY(table.c.id.type))))
+        )
+        facts_by_id = {fact.id: fact for fact in result}
+        return [facts_by_id[fact_id] for fact_id in ids]
+
     def _calculate_confidence(self, citations: list[dict[str, Any]]) -> float:
         """Calculate confidence score based on citations"""
         if not citations:
             return 0.0
 
-        confidences: list[Any] = [c.get("confidence", 0.0) for c in citations]
-        return sum(confidences) / len(confidences)
+        return fmean(c.get("confidence", 0.0) for c in citations)
 
     def _extract_date(self, text: str) -> datetime | None:
         """Extract date from text - simplified version"""
         # In production, use dateutil or similar
-        import re
-        from datetime import datetime
-
-        # Look for common date patterns
-        patterns = [
-            r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})",  # DD/MM/YYYY or DD-MM-YYYY
-            r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    # Simplified parsing - enhance in production
-                    return datetime.strptime(match.group(0), "%d/%m/%Y")
-                except ValueError:
-                    pass
-
-        return None
+        match = _DATE_PATTERN.search(text)
+        if not match:
+            return None
+
+        try:
+            # Simplified parsing - enhance in production
+            if match.lastgroup == "numeric":
+                return datetime.strptime(match.group(0).replace("-", "/"), "%d/%m/%Y")
+            return datetime.strptime(" ".join(match.group(0).split()), "%d %B %Y")
+        except ValueError:
+            return None
+
+    async def _check_fact_relations(self, fact: CaseFact) -> list[dict[str, Any]]:
+        """Check for related or conflicting facts, returning FactRelation rows to insert"""
+        if fact.fact_type not in self.RELATABLE_FACT_TYPES:
+            return []
 
-    async def _check_fact_relations(self, fact: CaseFact) -> None:
-        """Check for related or conflicting facts"""
         # Get similar facts in the same case
-        similar_facts = await self.db.execute(
+        similar_facts = await self.db.scalars(
             select(CaseFact).where(
                 and_(
                     CaseFact.case_id == fact.case_id,
@@ -286,54 +488,52 @@ class FactService:
                 )
             )
         )
-
-        for similar in similar_facts.scalars():
-            relation_type = self._determine_relation(fact, similar)
+        return self._relation_rows(fact, similar_facts)
+
+    def _relation_rows(self, fact: CaseFact, similar_facts: Iterable[CaseFact]) -> list[dict[str, Any]]:
+        """Build FactRelation rows linking a fact to the similar facts it relates to"""
+        fact_key = self._conflict_key(fact)
+        rows: list[dict[str, Any]] = []
+        for similar in similar_facts:
+            relation_type = self._determine_relation(fact_key, self._conflict_key(similar))
             if relation_type:
-                relation = FactRelation(
-                    fact_id=fact.id,
-                    related_fact_id=similar.id,
-                    relation_type=relation_type,
-                    confidence=0.8,  # Simplified - use NLP in production
+                rows.append(
+                    {
+                        "fact_id": fact.id,
+                        "related_fact_id": similar.id,
+                        "relation_type": relation_type,
+                        "confidence": 0.8,  # Simplified - use NLP in production
+                    }
                 )
-                self.db.add(relation)
+        return rows
+
+    @staticmethod
+    def _conflict_key(fact: CaseFact) -> ConflictKey:
+        """Read the attributes conflict detection compares once, as a plain tuple"""
+        return cast("ConflictKey", (fact.fact_type, fact.category, fact.fact_date, fact.fact_text))
 
-    def _facts_may_conflict(self, fact1: CaseFact, fact2: CaseFact) -> bool:
+    @staticmethod
+    def _keys_conflict(key1: ConflictKey, key2: ConflictKey) -> bool:
         """Simple conflict detection - enhance with NLP"""
-        # Use cast to tell the type checker these are instance values, not Column objects
-        type1 = cast("str | None", fact1.fact_type)
-        type2 = cast("str | None", fact2.fact_type)
+        type1, cat1, date1, text1 = key1
+        type2, cat2, date2, text2 = key2
 
-        if type1 != type2:
+        if type1 != type2 or cat1 != cat2:
             return False
 
         # Check for contradictory dates
         if type1 == "date":
-            # Access the actual attribute values
-            date1 = cast("datetime | None", fact1.fact_date)
-            date2 = cast("datetime | None", fact2.fact_date)
-            cat1 = cast("str | None", fact1.category)
-            cat2 = cast("str | None", fact2.category)
+            return date1 is not None and date2 is not None and date1 != date2
 
-            if date1 is not None and date2 is not None and cat1 == cat2 and date1 != date2:
-                return True
-
-        # Check for contradictory parties
+        # Check for contradictory parties - simple text comparison, enhance with NLP
         if type1 == "party":
-            # Simple text comparison - enhance with NLP
-            cat1 = cast("str | None", fact1.category)
-            cat2 = cast("str | None", fact2.category)
-            text1 = cast("str", fact1.fact_text)
-            text2 = cast("str", fact2.fact_text)
-
-            if cat1 == cat2 and text1 != text2:
-                return True
+            return text1 != text2
 
         return False
 
-    def _determine_relation(self, fact1: CaseFact, fact2: CaseFact) -> str | None:
-        """Determine relationship between facts"""
-        if self._facts_may_conflict(fact1, fact2):
+    def _determine_relation(self, key1: ConflictKey, key2: ConflictKey) -> str | None:
+        """Determine relationship between facts from their conflict keys"""
+        if self._keys_conflict(key1, key2):
             return "contradicts"
 
         # More sophisticated analysis would go here
@@ -1,6 +1,12 @@
+import asyncio
 import base64
+import hashlib
 import io
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import cv2  # type: ignore[import-untyped]
@@ -9,8 +15,263 @@ import numpy as np
 import pytesseract  # type: ignore[import-untyped]
 from PIL import Image
 
+from backend.config import settings
+from backend.utils.process_pool import get_process_pool
+
+try:
+    import blake3  # type: ignore[import-untyped]
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import numba  # type: ignore[import-untyped]
+except ImportError:
+    numba = None  # type: ignore[assignment]
+
+# Tesseract's own OpenMP threading is slower than single-threaded OCR run in parallel by the
+# process pool, and libtesseract reads this when loaded, so it must be set before tesserocr is imported
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr  # type: ignore[import-untyped]  # noqa: E402
+except ImportError:
+    tesserocr = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Per-process libtesseract handle shared by every OCR entry point (including EvidenceScanner), created on
+# first use so each pool worker loads the model once; the API is not thread-safe
+_tess_api: Any = None
+_tess_lock = threading.Lock()
+
+# Rendered scanned page: (width, height, 8-bit grayscale samples)
+PageRender = tuple[int, int, bytes]
+
+# OCR input: encoded image file bytes, or a raw grayscale page render
+OCRImage = bytes | PageRender
+
+# Scanned pages render so their long edge is about this many pixels (Tesseract's sweet spot),
+# between these DPI bounds; OCR cost grows with pixel area
+OCR_TARGET_LONG_EDGE_PX = 2000
+OCR_MIN_DPI = 150
+OCR_MAX_DPI = 300
+
+# Pages per Tesseract run when OCRing scanned PDFs; larger image lists can hang Tesseract
+OCR_BATCH_MAX_PAGES = 32
+
+# ITU-R BT.601 luma weights scaled by 256 (they sum to 256, so uint16 cannot overflow)
+_GRAY_WEIGHTS = np.array([77, 150, 29], dtype=np.uint16)
+
+# Most recent OCR results kept, keyed by the content of the image handed to Tesseract
+OCR_CACHE_SIZE = 1024
+
+
+def _content_key(kind: str, data: bytes) -> str:
+    """Hash OCR input bytes into a cache key, namespaced by entry point"""
+    hasher: Any = blake3.blake3(data) if blake3 is not None else hashlib.blake2b(data, digest_size=32)
+    return f"{kind}:{hasher.hexdigest()}"
+
+
+def _otsu_threshold(gray: np.ndarray) -> np.ndarray:
+    """Binarize a grayscale image at its Otsu threshold, computed from one histogram pass"""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    p = hist / hist.sum()
+    omega = np.cumsum(p)
+    mu = np.cumsum(p * np.arange(256))
+    # Between-class variance for every candidate threshold at once
+    sigma_b2 = (mu[-1] * omega - mu) ** 2 / (omega * (1 - omega) + 1e-12)
+    t = int(np.argmax(sigma_b2))
+    return (gray > t).astype(np.uint8) * 255
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)  # type: ignore[union-attr,misc]
+    def _rgb_to_gray_kernel(pixels: np.ndarray) -> np.ndarray:
+        """Fused RGB(A) to grayscale: one read of each pixel, one write, rows spread over cores"""
+        height, width = pixels.shape[0], pixels.shape[1]
+        out = np.empty((height, width), np.uint8)
+        for y in numba.prange(height):  # type: ignore[union-attr]
+            for x in range(width):
+                r, g, b = np.int32(pixels[y, x, 0]), np.int32(pixels[y, x, 1]), np.int32(pixels[y, x, 2])
+                out[y, x] = (77 * r + 150 * g + 29 * b) >> 8
+        return out
+
+
+def _rgb_to_gray(pixels: np.ndarray) -> np.ndarray:
+    """Convert RGB or RGBA pixels to grayscale with fixed-point BT.601 weights, ignoring alpha"""
+    if numba is not None:
+        return _rgb_to_gray_kernel(pixels)  # type: ignore[no-any-return]
+    return ((pixels[..., :3].astype(np.uint16) @ _GRAY_WEIGHTS) >> 8).astype(np.uint8)
+
+
+def _find_block_spans(data: dict[str, list[Any]]) -> list[np.ndarray]:
+    """Split Tesseract word data into blocks, returning the word indices of each block
+
+    Words without a positive confidence end the current block; recognised
+    words with text belong to it. Blocks are found with array ops rather than
+    a per-word Python state machine.
+    """
+    conf = np.array([float(c) if c not in (None, '') else -1.0 for c in data['conf']], dtype=np.float64)
+    has_text = np.array([bool(t and str(t).strip()) for t in data['text']], dtype=np.bool_)
+
+    recognised = conf > 0
+    block_ids = np.cumsum(~recognised)
+    word_indices = np.flatnonzero(recognised & has_text)
+    if not word_indices.size:
+        return []
+
+    word_blocks = block_ids[word_indices]
+    return np.split(word_indices, np.flatnonzero(np.diff(word_blocks)) + 1)
+
+
+def _get_tess_api() -> Any:
+    """Get this process's tesserocr API, creating it on first use (call with _tess_lock held)"""
+    global _tess_api
+    if _tess_api is None:
+        _tess_api = tesserocr.PyTessBaseAPI(lang='eng')  # type: ignore[union-attr]
+    return _tess_api
+
+
+def _gray_to_text(width: int, height: int, samples: bytes) -> str:
+    """OCR raw 8-bit grayscale pixels with the persistent tesserocr API, keeping the model loaded"""
+    with _tess_lock:
+        api = _get_tess_api()
+        api.SetImageBytes(samples, width, height, 1, width)
+        return str(api.GetUTF8Text())
+
+
+def _image_to_string(pixels: np.ndarray) -> str:
+    """OCR a grayscale image, in-process via tesserocr when installed, else via the tesseract CLI"""
+    if tesserocr is not None:
+        height, width = pixels.shape[:2]
+        return _gray_to_text(width, height, np.ascontiguousarray(pixels).tobytes())
+    return str(pytesseract.image_to_string(pixels, lang='eng'))  # type: ignore
+
+
+def ocr_image(image: OCRImage) -> str:
+    """OCR encoded image bytes or a raw grayscale render with this process's Tesseract handle
+
+    Raw renders are handed to Tesseract as plain pixel buffers, so no PIL
+    decode or colour conversion happens on the PDF page path.
+    """
+    if tesserocr is not None:
+        if isinstance(image, tuple):
+            return _gray_to_text(*image)
+        with _tess_lock:
+            api = _get_tess_api()
+            api.SetImage(Image.open(io.BytesIO(image)))  # type: ignore[no-untyped-call]
+            return str(api.GetUTF8Text())
+
+    if isinstance(image, tuple):
+        width, height, samples = image
+        pixels: Any = np.frombuffer(samples, dtype=np.uint8).reshape(height, width)
+    else:
+        pixels = Image.open(io.BytesIO(image))  # type: ignore[no-untyped-call]
+    result = pytesseract.image_to_string(pixels, lang='eng')  # type: ignore[no-any-return]
+    return str(result) if isinstance(result, str) else ""
+
+
+def ocr_image_batch(images: list[OCRImage]) -> list[str]:
+    """OCR a batch of images with one Tesseract handle, an empty string for any that fail (runs in a worker)"""
+    results: list[str] = []
+    for image in images:
+        try:
+            results.append(ocr_image(image))
+        except Exception:
+            results.append("")
+    return results
+
+
+def _text_from_data(data: dict[str, list[Any]]) -> str:
+    """Rebuild plain text from Tesseract word data: a newline per line, a blank line per paragraph"""
+    parts: list[str] = []
+    last_line: tuple[Any, Any, Any] | None = None
+    for i, word in enumerate(data['text']):
+        if not word or not str(word).strip():
+            continue
+        line = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        if last_line is not None:
+            if line[:2] != last_line[:2]:
+                parts.append("\n\n")
+            elif line != last_line:
+                parts.append("\n")
+            else:
+                parts.append(" ")
+        parts.append(str(word))
+        last_line = line
+    return "".join(parts)
+
+
+def _image_to_text_and_confidences(pixels: np.ndarray) -> tuple[str, list[float]]:
+    """OCR a grayscale image once, returning its text and the positive word confidences"""
+    if tesserocr is not None:
+        height, width = pixels.shape[:2]
+        with _tess_lock:
+            api = _get_tess_api()
+            api.SetImageBytes(np.ascontiguousarray(pixels).tobytes(), width, height, 1, width)
+            text = str(api.GetUTF8Text())
+            confidences = [float(conf) for conf in api.AllWordConfidences() if conf > 0]
+        return text, confidences
+
+    data: dict[str, list[Any]] = pytesseract.image_to_data(  # type: ignore
+        pixels, lang='eng', output_type=pytesseract.Output.DICT
+    )
+    confidences = [float(conf) for conf in data['conf'] if conf not in (None, '') and float(conf) > 0]
+    return _text_from_data(data), confidences
+
+
+def _render_dpi(page: Any) -> int:
+    """Pick a render DPI that puts the page's long edge near OCR_TARGET_LONG_EDGE_PX, within the DPI bounds"""
+    rect = page.rect
+    long_edge_in = max(rect.width, rect.height) / 72  # PDF points are 1/72 inch
+    if long_edge_in <= 0:
+        return OCR_MAX_DPI
+    return int(min(OCR_MAX_DPI, max(OCR_MIN_DPI, OCR_TARGET_LONG_EDGE_PX / long_edge_in)))
+
+
+def _write_pgm(path: str, page: PageRender) -> None:
+    """Write a raw grayscale render as binary PGM, which Tesseract reads without decompression"""
+    width, height, samples = page
+    with open(path, "wb") as f:
+        f.write(f"P5\n{width} {height}\n255\n".encode())
+        f.write(samples)
+
+
+def _ocr_page_batch(pages: list[PageRender]) -> list[str]:
+    """OCR several rendered PDF pages with one Tesseract run (runs in a worker process)
+
+    Tesseract accepts a text file listing image paths and separates each
+    page's output with a form feed, so the model is loaded once per batch.
+    With tesserocr installed the worker's persistent API is used instead.
+    """
+    if tesserocr is not None:
+        return [_gray_to_text(*page) for page in pages]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_paths: list[str] = []
+        for index, page in enumerate(pages):
+            image_path = os.path.join(tmp_dir, f"page-{index}.pgm")
+            _write_pgm(image_path, page)
+            image_paths.append(image_path)
+
+        if len(image_paths) == 1:
+            return [str(pytesseract.image_to_string(image_paths[0], lang='eng'))]  # type: ignore
+
+        list_path = os.path.join(tmp_dir, "pages.txt")
+        with open(list_path, "w") as f:
+            f.write("\n".join(image_paths))
+
+        output = str(pytesseract.image_to_string(list_path, lang='eng', config='--psm 3'))  # type: ignore
+        texts = output.split("\f")
+        if texts and not texts[-1].strip():
+            texts.pop()
+        if len(texts) != len(pages):
+            # Page boundaries were lost; fall back to one run per page
+            return [str(pytesseract.image_to_string(path, lang='eng')) for path in image_paths]  # type: ignore
+        return texts
+
+
 class OCRService:
     """Service for OCR and image processing capabilities"""
 
@@ -21,6 +282,21 @@ class OCRService:
         except Exception as e:
             logger.warning(f"Tesseract not found: {e}. OCR functionality will be limited.")
 
+        self._ocr_cache: OrderedDict[str, Any] = OrderedDict()
+
+    def _cached_ocr(self, key: str) -> Any:
+        """Return a cached OCR result, marking it most recently used"""
+        result = self._ocr_cache.get(key)
+        if result is not None:
+            self._ocr_cache.move_to_end(key)
+        return result
+
+    def _cache_ocr(self, key: str, result: Any) -> None:
+        """Store an OCR result, evicting the least recently used beyond OCR_CACHE_SIZE"""
+        self._ocr_cache[key] = result
+        if len(self._ocr_cache) > OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+
     async def extract_text_from_image(self, image_path: str) -> dict[str, Any]:
         """Extract text from an image file using OCR"""
         try:
@@ -34,25 +310,27 @@ class OCRService:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
             # Apply thresholding to preprocess the image
-            thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
-
-            # Perform OCR
-            text: str = pytesseract.image_to_string(thresh, lang='eng')  # type: ignore
+            thresh = _otsu_threshold(gray)
 
-            # Also get detailed data
-            data: dict[str, list[Any]] = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT)  # type: ignore
+            # Identical images (re-uploads, previews) skip Tesseract entirely
+            cache_key = _content_key(f"image{thresh.shape}", thresh.tobytes())
+            cached = self._cached_ocr(cache_key)
+            if cached is not None:
+                return dict(cached)
 
-            # Extract confidence scores
-            confidences = [int(str(conf)) for conf in data['conf'] if conf and int(str(conf)) > 0]
+            # Perform OCR - one recognition pass yields both the text and the word confidences
+            text, confidences = _image_to_text_and_confidences(thresh)
             avg_confidence = sum(confidences) / len(confidences) if confidences else 0
 
-            return {
+            result = {
                 "text": text.strip(),
                 "confidence": avg_confidence,
                 "word_count": len(text.split()),
                 "language": "en",
                 "success": True
             }
+            self._cache_ocr(cache_key, result)
+            return dict(result)
 
         except Exception as e:
             logger.error(f"OCR error: {e}")
@@ -62,11 +340,16 @@ class OCRService:
                 "success": False
             }
 
-    async def extract_text_from_pdf(self, pdf_path: str) -> dict[str, Any]:
-        """Extract text from PDF, including scanned PDFs"""
+    async def extract_text_from_pdf(self, pdf_path: str, include_full_text: bool = True) -> dict[str, Any]:
+        """Extract text from PDF, including scanned PDFs
+
+        Callers that only read the per-page text can skip building the joined
+        full_text copy with include_full_text=False.
+        """
         try:
             pdf_document = fitz.open(pdf_path)  # type: ignore
             all_text: list[dict[str, Any]] = []
+            scanned_pages: list[tuple[int, PageRender]] = []
             total_pages = len(pdf_document)  # type: ignore
 
             for page_num in range(total_pages):
@@ -75,17 +358,11 @@ class OCRService:
                 # Try to extract text directly
                 text: str = page.get_text()  # type: ignore
 
-                # If no text found, it might be a scanned PDF
+                # If no text found, it might be a scanned PDF - render it for OCR below
                 if not text or not text.strip():  # type: ignore[union-attr]
-                    # Convert page to image
-                    pix = page.get_pixmap(dpi=300)  # type: ignore
-                    img_data: bytes = pix.tobytes("png")  # type: ignore
-
-                    # Convert to PIL Image
-                    image = Image.open(io.BytesIO(img_data))  # type: ignore
-
-                    # Perform OCR
-                    text = pytesseract.image_to_string(image, lang='eng')  # type: ignore
+                    # Raw grayscale samples go straight to Tesseract - no PNG encode/decode round-trip
+                    pix = page.get_pixmap(colorspace=fitz.csGRAY, dpi=_render_dpi(page))  # type: ignore
+                    scanned_pages.append((page_num, (pix.width, pix.height, pix.samples)))  # type: ignore
 
                 all_text.append({
                     "page": page_num + 1,
@@ -94,12 +371,39 @@ class OCRService:
 
             pdf_document.close()  # type: ignore
 
-            return {
+            # Reuse cached text for pages seen before, then OCR the rest in parallel across the process pool
+            pending: list[tuple[int, str, PageRender]] = []
+            for page_num, render in scanned_pages:
+                width, height, samples = render
+                cache_key = _content_key(f"page({width}, {height})", samples)
+                cached = self._cached_ocr(cache_key)
+                if cached is not None:
+                    all_text[page_num]["text"] = cached
+                else:
+                    pending.append((page_num, cache_key, render))
+
+            if pending:
+                # Spread the pages over the pool workers in batches of at most OCR_BATCH_MAX_PAGES
+                batch_size = min(OCR_BATCH_MAX_PAGES, -(-len(pending) // settings.ocr_max_workers))
+                images = [render for _, _, render in pending]
+                batches = [images[i : i + batch_size] for i in range(0, len(images), batch_size)]
+                loop = asyncio.get_running_loop()
+                batch_texts = await asyncio.gather(
+                    *(loop.run_in_executor(get_process_pool(), _ocr_page_batch, batch) for batch in batches)
+                )
+                ocr_texts = [text for texts in batch_texts for text in texts]
+                for (page_num, cache_key, _), ocr_text in zip(pending, ocr_texts, strict=True):
+                    all_text[page_num]["text"] = ocr_text.strip()
+                    self._cache_ocr(cache_key, all_text[page_num]["text"])
+
+            result: dict[str, Any] = {
                 "pages": all_text,
                 "total_pages": total_pages,
-                "full_text": "\n\n".join([p["text"] for p in all_text]),
                 "success": True
             }
+            if include_full_text:
+                result["full_text"] = "\n\n".join(p["text"] for p in all_text)
+            return result
 
         except Exception as e:
             logger.error(f"PDF extraction error: {e}")
@@ -117,20 +421,22 @@ class OCRService:
             image = Image.open(io.BytesIO(image_data))  # type: ignore
 
             # Convert PIL Image to numpy array
-            img_array = np.array(image)  # type: ignore[no-untyped-call]
+            if image.mode not in ("L", "RGB", "RGBA"):
+                image = image.convert("RGB")  # type: ignore[no-untyped-call]
+            img_array = np.asarray(image)  # type: ignore[no-untyped-call]
 
-            # If image has alpha channel, remove it
-            if img_array.shape[-1] == 4:
-                img_array = cv2.cvtColor(img_array, cv2.COLOR_RGBA2RGB)  # type: ignore[no-untyped-call]
-
-            # Convert to grayscale
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)  # type: ignore[no-untyped-call]
+            # Convert to grayscale, ignoring any alpha channel
+            gray = _rgb_to_gray(img_array) if img_array.ndim == 3 else img_array
 
-            # Perform OCR
-            text: str = pytesseract.image_to_string(gray, lang='eng')  # type: ignore
+            cache_key = _content_key(f"base64{gray.shape}", gray.tobytes())
+            cached = self._cached_ocr(cache_key)
+            if cached is None:
+                # Perform OCR
+                cached = _image_to_string(gray).strip()
+                self._cache_ocr(cache_key, cached)
 
             return {
-                "text": text.strip(),
+                "text": cached,
                 "success": True
             }
 
@@ -156,29 +462,24 @@ class OCRService:
             data: dict[str, list[Any]] = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT)  # type: ignore
 
             # Group text by blocks
-            blocks: list[list[dict[str, Any]]] = []
-            current_block: list[dict[str, Any]] = []
-
-            for i in range(len(data['text'])):
-                if data['conf'][i] and int(str(data['conf'][i])) > 0:
-                    if data['text'][i] and str(data['text'][i]).strip():
-                        current_block.append({
-                            'text': data['text'][i],
-                            'x': data['left'][i],
-                            'y': data['top'][i],
-                            'width': data['width'][i],
-                            'height': data['height'][i],
-                            'confidence': data['conf'][i]
-                        })
-                elif current_block:
-                    blocks.append(current_block)
-                    current_block = []
-
-            if current_block:
-                blocks.append(current_block)
+            spans = _find_block_spans(data)
+            blocks: list[list[dict[str, Any]]] = [
+                [
+                    {
+                        'text': data['text'][i],
+                        'x': data['left'][i],
+                        'y': data['top'][i],
+                        'width': data['width'][i],
+                        'height': data['height'][i],
+                        'confidence': data['conf'][i]
+                    }
+                    for i in span
+                ]
+                for span in spans
+            ]
 
             # Identify document sections
-            sections = self._identify_sections(blocks)
+            sections = self._identify_sections(spans, data)
 
             return {
                 "blocks": blocks,
@@ -194,19 +495,30 @@ class OCRService:
                 "success": False
             }
 
-    def _identify_sections(self, blocks: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
-        """Identify document sections like headers, paragraphs, etc."""
+    def _identify_sections(self, spans: list[np.ndarray], data: dict[str, list[Any]]) -> list[dict[str, Any]]:
+        """Identify document sections like headers, paragraphs, etc.
+
+        Works on the word columns of Tesseract's data as arrays, with blocks
+        given as spans of word indices.
+        """
+        if not spans:
+            return []
+
+        # Average font size per block (approximated by height), for all blocks at once
+        word_indices = np.concatenate(spans)
+        lengths = np.array([len(span) for span in spans])
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        heights = np.asarray(data['height'], dtype=np.int32)[word_indices]
+        avg_heights = np.add.reduceat(heights, offsets) / lengths
+
+        xs = np.asarray(data['left'], dtype=np.int32)
+        ys = np.asarray(data['top'], dtype=np.int32)
+        texts = data['text']
         sections: list[dict[str, Any]] = []
 
-        for block in blocks:
-            if not block:
-                continue
-
-            # Calculate average font size (approximated by height)
-            avg_height = sum(word['height'] for word in block) / len(block)
-
+        for span, avg_height in zip(spans, avg_heights.tolist(), strict=True):
             # Determine section type based on characteristics
-            text = ' '.join(word['text'] for word in block)
+            text = ' '.join(texts[i] for i in span)
 
             section_type = "paragraph"  # default
 
@@ -222,8 +534,8 @@ class OCRService:
                 "type": section_type,
                 "text": text,
                 "position": {
-                    "x": block[0]['x'],
-                    "y": block[0]['y']
+                    "x": int(xs[span[0]]),
+                    "y": int(ys[span[0]])
                 }
             })
 
@@ -1,31 +1,60 @@
+import functools
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta
+
+from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Marks a templates directory whose layout and default templates have been created
+BOOTSTRAP_SENTINEL = ".bootstrap_v1"
+
+# Classifies a template variable for preview data in one match; the alternatives are tried in
+# order, so a variable containing both "name" and "date" is still treated as a name
+SAMPLE_VARIABLE_PATTERN = re.compile(r"(?=.*(name))|(?=.*(address))|(?=.*(date))")
+
 
 class TemplatesService:
     """Service for managing legal document templates"""
 
     def __init__(self):
         self.templates_dir = Path("templates")
+        self.categories = ["contracts", "letters", "court_forms", "agreements", "notices", "wills"]
+        bytecode_dir = self.templates_dir / ".jinja_cache"
+
+        # Create the directory layout and default templates once; later starts only check the sentinel
+        sentinel = self.templates_dir / BOOTSTRAP_SENTINEL
+        if not sentinel.exists():
+            self._bootstrap()
+            sentinel.touch()
+        # The cache directory is gitignored and may be wiped independently of the sentinel
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+        # Initialize Jinja2 environment; compiled templates persist across restarts in the bytecode cache,
+        # and outside debug mode Jinja trusts its in-memory cache instead of stat-ing files on every render
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=True,
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+            auto_reload=settings.debug,
+        )
+
+        # Parsed templates keyed by path: (mtime_ns, content, variables)
+        self._template_cache: dict[str, tuple[int, str, list[str]]] = {}
+
+    def _bootstrap(self) -> None:
+        """Create the templates directory, category subdirectories and default templates"""
         self.templates_dir.mkdir(exist_ok=True)
 
         # Create subdirectories for different template categories
-        self.categories = ["contracts", "letters", "court_forms", "agreements", "notices", "wills"]
         for category in self.categories:
             (self.templates_dir / category).mkdir(exist_ok=True)
 
-        # Initialize Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
-        )
-
         # Create default templates if they don't exist
         self._create_default_templates()
 
@@ -248,17 +277,23 @@ class TemplatesService:
         if not full_path.exists():
             return None
 
-        content = full_path.read_text()
+        # Reuse the content and variables parsed last time unless the file has changed since
+        mtime_ns = full_path.stat().st_mtime_ns
+        cached = self._template_cache.get(template_path)
+        if cached and cached[0] == mtime_ns:
+            _, content, variables = cached
+        else:
+            content = full_path.read_text()
 
-        # Extract variables from template
-        from jinja2 import meta
-        ast = self.env.parse(content)
-        variables = list(meta.find_undeclared_variables(ast))
+            # Extract variables from template
+            ast = self.env.parse(content)
+            variables = list(meta.find_undeclared_variables(ast))
+            self._template_cache[template_path] = (mtime_ns, content, variables)
 
         return {
             "path": template_path,
             "content": content,
-            "variables": variables,
+            "variables": list(variables),
             "name": full_path.stem.replace("_", " ").title()
         }
 
@@ -303,6 +338,7 @@ class TemplatesService:
             return False
 
         full_path.write_text(content)
+        self._forget_template(template_path)
         return True
 
     async def delete_template(self, template_path: str) -> bool:
@@ -312,8 +348,16 @@ class TemplatesService:
             return False
 
         full_path.unlink()
+        self._forget_template(template_path)
         return True
 
+    def _forget_template(self, template_path: str) -> None:
+        """Drop cached copies of a template after it is changed through the service"""
+        self._template_cache.pop(template_path, None)
+        if self.env.cache is not None:
+            # Jinja does not re-check files when auto_reload is off, so evict the compiled template too
+            self.env.cache.clear()
+
     async def get_template_preview(self, template_path: str, sample_data: dict[str, Any] | None = None) -> str:
         """Get a preview of a template with sample data"""
         if sample_data is None:
@@ -322,21 +366,20 @@ class TemplatesService:
             if not template_info:
                 return ""
 
+            # Sample values indexed by the matching group of SAMPLE_VARIABLE_PATTERN
+            samples = (None, "John Smith", "123 Example Street, London", datetime.now().strftime("%d %B %Y"))
+
             generated_data: dict[str, Any] = {}
             variables: list[str] = template_info["variables"]
             for var in variables:
-                if "name" in var:
-                    generated_data[var] = "John Smith"
-                elif "address" in var:
-                    generated_data[var] = "123 Example Street, London"
-                elif "date" in var:
-                    generated_data[var] = datetime.now().strftime("%d %B %Y")
-                else:
-                    generated_data[var] = f"[{var}]"
+                match = SAMPLE_VARIABLE_PATTERN.match(var)
+                generated_data[var] = samples[match.lastindex] if match and match.lastindex else f"[{var}]"
             sample_data = generated_data
 
         return await self.render_template(template_path, sample_data)
 
 
-# Singleton instance
-templates_service = TemplatesService()
+@functools.cache
+def get_templates_service() -> TemplatesService:
+    """Get the shared TemplatesService, created on first use so importing this module touches no files"""
+    return TemplatesService()
@@ -1,28 +1,133 @@
 import asyncio
+import contextlib
+import functools
+import hashlib
 
 # import soundfile as sf  # Unused import
 import io
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pyttsx3  # type: ignore[import-untyped]
 import speech_recognition as sr  # type: ignore[import-untyped]
 
+from backend.config import settings
+
+try:
+    from google.cloud import speech  # type: ignore[import-untyped]
+except ImportError:
+    speech = None  # type: ignore[assignment]
+
+try:
+    import webrtcvad  # type: ignore[import-untyped]
+except ImportError:
+    webrtcvad = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Seconds a measured ambient noise profile is reused before it is measured again
+NOISE_PROFILE_TTL = 60.0
+
+# Recognition input: 16 kHz 16-bit mono PCM, screened by VAD in 30 ms frames when webrtcvad is installed
+STT_SAMPLE_RATE = 16000
+VAD_FRAME_BYTES = STT_SAMPLE_RATE * 2 * 30 // 1000
+VAD_AGGRESSIVENESS = 2
+
+# Audio sent per StreamingRecognize request when Google Cloud Speech is available
+STREAM_CHUNK_MS = 750
+
+# Concurrent streams multiplexed on one SpeechClient channel before another client is opened
+STREAMS_PER_CLIENT = 100
+
+# pyttsx3 drivers can only save to a path, so render into RAM-backed tmpfs where the platform has one
+TTS_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Recognition calls allowed in flight at once; further callers wait on the event loop
+STT_MAX_IN_FLIGHT = 16
+
+# Transcripts and synthesised clips kept when settings.voice_cache_enabled is on
+VOICE_CACHE_SIZE = 256
+
+# Common legal term corrections
+LEGAL_TERMS = {
+    'claimant': 'Claimant',
+    'defendant': 'Defendant',
+    'respondent': 'Respondent',
+    'applicant': 'Applicant',
+    'court': 'Court',
+    'judge': 'Judge',
+    'solicitor': 'Solicitor',
+    'barrister': 'Barrister',
+    'act': 'Act',
+    'section': 'Section',
+    'paragraph': 'Paragraph',
+    'schedule': 'Schedule',
+}
+_LEGAL_RE = re.compile(r'\b(' + '|'.join(map(re.escape, LEGAL_TERMS)) + r')\b', re.IGNORECASE)
+
+# Legal dictation formatting: case citations, section references and act references
+_CASE_CITE_RE = re.compile(r'(\w+) versus (\w+) (\d{4})', re.IGNORECASE)
+_SECTION_RE = re.compile(r'section (\d+)', re.IGNORECASE)
+_ACT_RE = re.compile(r'(\w+) act (\d{4})', re.IGNORECASE)
+
 
 class VoiceService:
     """Service for voice dictation and text-to-speech capabilities"""
 
     def __init__(self):
         self.recognizer = sr.Recognizer()
+        # Recognition is network-bound, so it gets its own pool with back-pressure in front of it
+        self._stt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="stt")
+        self._stt_sem = asyncio.Semaphore(STT_MAX_IN_FLIGHT)
+        self._stt_waiting = 0
+
+        # pyttsx3 shares one engine per driver and its runAndWait loop is not thread-safe, so a dedicated
+        # thread owns the engine and all TTS work runs there
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+        # Engine properties as last applied, so unchanged voice settings skip the driver round-trip
+        self._engine_settings: dict[str, Any] = {}
+
+        # Ambient noise profile from an earlier clip, and when it was measured
+        self._cached_energy_threshold: float | None = None
+        self._calibrated_at = 0.0
+        self._vad = webrtcvad.Vad(VAD_AGGRESSIVENESS) if webrtcvad is not None else None
+
+        # Google Cloud Speech clients and their open stream counts; one is opened up front so the first
+        # request skips channel and TLS setup, and every stream after that shares its HTTP/2 connection
+        self._speech_clients: list[Any] = []
+        self._client_streams: list[int] = []
+        self._speech_lock = threading.Lock()
+        # Set once a client cannot be created at all (e.g. no Cloud credentials), so calls skip straight to the web API
+        self._speech_failed = False
+        if speech is not None:
+            try:
+                self._speech_clients.append(self._open_speech_client())
+                self._client_streams.append(0)
+            except Exception as e:
+                logger.warning(f"Could not prewarm Google Cloud Speech client: {e}")
+
+        # Recent results, least recently used first: transcripts by audio digest, TTS audio by text and settings
+        self._stt_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._tts_cache: OrderedDict[tuple[Any, ...], bytes] = OrderedDict()
+
+        self._tts_pool.submit(self._init_engine).result()
+
+    def _init_engine(self) -> None:
+        """Create and configure the TTS engine on the TTS thread"""
         self.engine = pyttsx3.init()  # type: ignore[no-untyped-call]
-        self.executor = ThreadPoolExecutor(max_workers=2)
 
         # Configure TTS engine
-        self.engine.setProperty('rate', 150)  # type: ignore[no-untyped-call]  # Speed of speech
-        self.engine.setProperty('volume', 0.9)  # type: ignore[no-untyped-call]  # Volume level (0.0 to 1.0)
+        self._set_engine_property('rate', 150)  # Speed of speech
+        self._set_engine_property('volume', 0.9)  # Volume level (0.0 to 1.0)
 
         # Get available voices
         voices = self.engine.getProperty('voices')  # type: ignore[no-untyped-call]
@@ -30,29 +135,33 @@ class VoiceService:
             # Try to use a British English voice if available
             for voice in voices:  # type: ignore[union-attr]
                 if 'english' in voice.name.lower() and 'uk' in voice.name.lower():  # type: ignore[union-attr]
-                    self.engine.setProperty('voice', voice.id)  # type: ignore[no-untyped-call,union-attr]
+                    self._set_engine_property('voice', voice.id)  # type: ignore[union-attr]
                     break
 
-    async def transcribe_audio(self, audio_data: bytes, _audio_format: str = "wav") -> dict[str, Any]:  # Format for future use
-        """Transcribe audio to text"""
-        try:
-            # Convert audio data to AudioFile format
-            audio_file = sr.AudioFile(io.BytesIO(audio_data))  # type: ignore[no-untyped-call]
+    async def transcribe_audio(
+        self,
+        audio_data: bytes,
+        _audio_format: str = "wav",  # Format for future use
+        skip_ambient: bool = False,
+    ) -> dict[str, Any]:
+        """Transcribe audio to text
 
-            with audio_file as source:
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)  # type: ignore[no-untyped-call]
-                audio = self.recognizer.record(source)  # type: ignore[no-untyped-call]
+        Pass skip_ambient=True when the audio has already been denoised or trimmed by VAD upstream.
+        """
+        key = hashlib.blake2b(audio_data, digest_size=16).digest() if settings.voice_cache_enabled else None
+        if key is not None and (cached := self._cache_get(self._stt_cache, key)) is not None:
+            return dict(cached)
+
+        try:
+            # Decoding, the noise profile, resampling and VAD are CPU work, so they run on the STT pool too
+            audio = await self._run_stt(self._record, audio_data, skip_ambient)
 
             # Try multiple recognition engines for better accuracy
             results: dict[str, str | None] = {}
 
-            # Google Speech Recognition (free, no API key required)
+            # Google Cloud streaming recognition when installed, else the free web API (no API key required)
             try:
-                text_google: str = await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    lambda: self.recognizer.recognize_google(audio, "en-GB")  # type: ignore[attr-defined,no-any-return]
-                )
+                text_google: str = await self._run_stt(self._recognize, audio)
                 results['google'] = text_google
             except Exception as e:
                 logger.warning(f"Google Speech Recognition failed: {e}")
@@ -71,13 +180,16 @@ class VoiceService:
             # Perform basic punctuation and formatting
             formatted_text: str = self._format_legal_text(final_text)
 
-            return {
+            result: dict[str, Any] = {
                 "success": True,
                 "text": formatted_text,
                 "raw_text": final_text,
                 "confidence": 0.8,  # Approximate confidence
                 "language": "en-GB"
             }
+            if key is not None:
+                self._cache_put(self._stt_cache, key, dict(result))
+            return result
 
         except Exception as e:
             logger.error(f"Voice transcription error: {e}")
@@ -87,6 +199,140 @@ class VoiceService:
                 "text": ""
             }
 
+    async def _run_stt(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking recognition call on the STT pool, holding callers beyond STT_MAX_IN_FLIGHT"""
+        self._stt_waiting += 1
+        try:
+            if self._stt_sem.locked():
+                logger.warning(f"Speech recognition saturated: {self._stt_waiting} requests waiting")
+            await self._stt_sem.acquire()
+        finally:
+            self._stt_waiting -= 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._stt_pool, func, *args)
+        finally:
+            self._stt_sem.release()
+
+    def _record(self, audio_data: bytes, skip_ambient: bool) -> Any:
+        """Decode the clip into 16 kHz AudioData, applying the ambient noise profile unless skipped"""
+        # Convert audio data to AudioFile format
+        audio_file = sr.AudioFile(io.BytesIO(audio_data))  # type: ignore[no-untyped-call]
+
+        with audio_file as source:
+            # Adjust for ambient noise, reusing a recent profile instead of measuring every clip;
+            # with VAD trimming the clip below this is redundant. record() does not consult
+            # energy_threshold, so the saving is that a fresh profile leaves the first second unconsumed
+            if not skip_ambient and self._vad is None:
+                self._apply_noise_profile(source)
+            audio = self.recognizer.record(source)  # type: ignore[no-untyped-call]
+        return self._speech_pcm(audio)
+
+    def _speech_pcm(self, audio: Any) -> Any:
+        """Resample to 16 kHz 16-bit mono once and drop non-speech frames when VAD is available"""
+        pcm: bytes = audio.get_raw_data(convert_rate=STT_SAMPLE_RATE, convert_width=2)
+        if self._vad is not None:
+            frames = (pcm[i:i + VAD_FRAME_BYTES] for i in range(0, len(pcm) - VAD_FRAME_BYTES + 1, VAD_FRAME_BYTES))
+            voiced = b"".join(frame for frame in frames if self._vad.is_speech(frame, STT_SAMPLE_RATE))
+            # Leave a clip with no detected speech whole and let the recogniser decide
+            if voiced:
+                pcm = voiced
+        return sr.AudioData(pcm, STT_SAMPLE_RATE, 2)  # type: ignore[no-untyped-call]
+
+    @contextlib.contextmanager
+    def _speech_client_slot(self) -> Iterator[Any]:
+        """Lease the least busy SpeechClient, opening another once each carries STREAMS_PER_CLIENT streams"""
+        with self._speech_lock:
+            slot = min(range(len(self._client_streams)), key=self._client_streams.__getitem__, default=None)
+            if slot is not None and self._client_streams[slot] < STREAMS_PER_CLIENT:
+                self._client_streams[slot] += 1
+            else:
+                slot = None
+        if slot is None:
+            # Channel and credential setup is slow, so it runs outside the lock and other streams keep leasing
+            client = self._open_speech_client()
+            with self._speech_lock:
+                self._speech_clients.append(client)
+                self._client_streams.append(1)
+                slot = len(self._client_streams) - 1
+        try:
+            yield self._speech_clients[slot]
+        finally:
+            with self._speech_lock:
+                self._client_streams[slot] -= 1
+
+    def _open_speech_client(self) -> Any:
+        """Create a SpeechClient, remembering when none can be created so later calls skip Cloud"""
+        try:
+            return speech.SpeechClient()
+        except Exception:
+            if not self._speech_clients:
+                self._speech_failed = True
+            raise
+
+    def _streaming_responses(self, audio: Any) -> Iterator[Any]:
+        """Run a StreamingRecognize call that uploads the clip as 16-bit PCM in STREAM_CHUNK_MS chunks"""
+        pcm: bytes = audio.get_raw_data(convert_width=2)
+        chunk_size = audio.sample_rate * 2 * STREAM_CHUNK_MS // 1000
+        config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=audio.sample_rate,
+                language_code="en-GB",
+            ),
+        )
+        requests = (
+            speech.StreamingRecognizeRequest(audio_content=pcm[i:i + chunk_size])
+            for i in range(0, len(pcm), chunk_size)
+        )
+        with self._speech_client_slot() as client:
+            yield from client.streaming_recognize(config=config, requests=requests)
+
+    def _recognize(self, audio: Any) -> str:
+        """Recognise with Google Cloud streaming, falling back to the free web API when Cloud is unusable"""
+        if speech is not None and not self._speech_failed:
+            try:
+                return self._recognize_streaming(audio)
+            except Exception as e:
+                logger.warning(f"Google Cloud Speech failed, using the web API: {e}")
+        return self.recognizer.recognize_google(audio, "en-GB")  # type: ignore[attr-defined,no-any-return]
+
+    def _recognize_streaming(self, audio: Any) -> str:
+        """Stream the clip to Google Cloud Speech and join the final transcripts"""
+        return " ".join(
+            result.alternatives[0].transcript.strip()
+            for response in self._streaming_responses(audio)
+            for result in response.results
+            if result.is_final and result.alternatives
+        )
+
+    async def calibrate(self, audio_data: bytes) -> float:
+        """Measure the ambient noise profile from a sample clip for reuse by later transcriptions"""
+        # Decoding and the noise pass are blocking and share self.recognizer with the STT threads
+        return await self._run_stt(self._calibrate, audio_data)
+
+    def _calibrate(self, audio_data: bytes) -> float:
+        """Decode a sample clip and measure its noise profile on the STT pool"""
+        audio_file = sr.AudioFile(io.BytesIO(audio_data))  # type: ignore[no-untyped-call]
+        with audio_file as source:
+            return self._measure_noise_profile(source)
+
+    def _apply_noise_profile(self, source: Any) -> None:
+        """Use the cached energy threshold while it is fresh, otherwise measure it from the source"""
+        fresh = time.monotonic() - self._calibrated_at < NOISE_PROFILE_TTL
+        if self._cached_energy_threshold is not None and fresh:
+            self.recognizer.energy_threshold = self._cached_energy_threshold
+            self.recognizer.dynamic_energy_threshold = False
+        else:
+            self._measure_noise_profile(source)
+
+    def _measure_noise_profile(self, source: Any) -> float:
+        """Run the one-second ambient noise pass and cache the resulting energy threshold"""
+        self.recognizer.adjust_for_ambient_noise(source, duration=1)  # type: ignore[no-untyped-call]
+        self._cached_energy_threshold = float(self.recognizer.energy_threshold)
+        self._calibrated_at = time.monotonic()
+        return self._cached_energy_threshold
+
     def _format_legal_text(self, text: str) -> str:
         """Format transcribed text for legal documents"""
         # Capitalize first letter of sentences
@@ -98,76 +344,83 @@ class VoiceService:
         if text and not text.endswith('.'):
             text += '.'
 
-        # Common legal term corrections
-        legal_terms = {
-            'claimant': 'Claimant',
-            'defendant': 'Defendant',
-            'respondent': 'Respondent',
-            'applicant': 'Applicant',
-            'court': 'Court',
-            'judge': 'Judge',
-            'solicitor': 'Solicitor',
-            'barrister': 'Barrister',
-            'act': 'Act',
-            'section': 'Section',
-            'paragraph': 'Paragraph',
-            'schedule': 'Schedule',
-        }
-
-        for term, replacement in legal_terms.items():
-            text = text.replace(f' {term} ', f' {replacement} ')
-            text = text.replace(f' {term}.', f' {replacement}.')
-            text = text.replace(f' {term},', f' {replacement},')
-
-        return text
+        # Common legal term corrections, in a single pass
+        return _LEGAL_RE.sub(lambda m: LEGAL_TERMS[m.group(1).lower()], text)
 
     async def text_to_speech(self, text: str, voice_settings: dict[str, Any] | None = None) -> bytes:
         """Convert text to speech audio"""
         try:
-            # Apply voice settings if provided
-            if voice_settings:
-                if 'rate' in voice_settings:
-                    self.engine.setProperty('rate', voice_settings['rate'])  # type: ignore[no-untyped-call]
-                if 'volume' in voice_settings:
-                    self.engine.setProperty('volume', voice_settings['volume'])  # type: ignore[no-untyped-call]
-                if 'voice_id' in voice_settings:
-                    self.engine.setProperty('voice', voice_settings['voice_id'])  # type: ignore[no-untyped-call]
-
-            # Save to temporary file (pyttsx3 limitation)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-
             # Generate speech
-            await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                self._save_to_file,
-                text,
-                tmp_path
+            return await asyncio.get_event_loop().run_in_executor(
+                self._tts_pool, self._synthesize, text, voice_settings
             )
 
-            # Read the audio file
-            with open(tmp_path, 'rb') as f:
-                audio_data = f.read()
-
-            # Clean up
-            import os
-            os.unlink(tmp_path)
-
-            return audio_data
-
         except Exception as e:
             logger.error(f"Text-to-speech error: {e}")
             raise
 
+    def _synthesize(self, text: str, voice_settings: dict[str, Any] | None) -> bytes:
+        """Render speech to a scratch file and return its bytes, all on the TTS thread"""
+        # Apply voice settings if provided
+        if voice_settings:
+            if 'rate' in voice_settings:
+                self._set_engine_property('rate', voice_settings['rate'])
+            if 'volume' in voice_settings:
+                self._set_engine_property('volume', voice_settings['volume'])
+            if 'voice_id' in voice_settings:
+                self._set_engine_property('voice', voice_settings['voice_id'])
+
+        # Output depends only on the text and the engine settings now in effect
+        key = None
+        if settings.voice_cache_enabled:
+            key = (text, *(self._engine_settings.get(name) for name in ('rate', 'volume', 'voice')))
+            if (cached := self._cache_get(self._tts_cache, key)) is not None:
+                return cached
+
+        fd, path = tempfile.mkstemp(suffix='.wav', dir=TTS_SCRATCH_DIR)
+        os.close(fd)
+        try:
+            self._save_to_file(text, path)
+            with open(path, 'rb') as f:
+                audio_data = f.read()
+        finally:
+            os.unlink(path)
+
+        if key is not None:
+            self._cache_put(self._tts_cache, key, audio_data)
+        return audio_data
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict[Any, Any], key: Any) -> Any:
+        """Look up a cached result, marking it most recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+        """Store a result, evicting the least recently used beyond VOICE_CACHE_SIZE"""
+        cache[key] = value
+        if len(cache) > VOICE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _set_engine_property(self, name: str, value: Any) -> None:
+        """Set a TTS engine property, skipping the driver call when the value is unchanged"""
+        if self._engine_settings.get(name) != value:
+            self.engine.setProperty(name, value)  # type: ignore[no-untyped-call]
+            self._engine_settings[name] = value
+
     def _save_to_file(self, text: str, filename: str) -> None:
-        """Helper method to save TTS to file"""
+        """Helper method to save TTS to file; runAndWait blocks until synthesis is done, so no stop() is needed"""
         self.engine.save_to_file(text, filename)  # type: ignore[no-untyped-call]
         self.engine.runAndWait()  # type: ignore[no-untyped-call]
 
     async def get_available_voices(self) -> list[dict[str, Any]]:
         """Get list of available TTS voices"""
-        voices = self.engine.getProperty('voices')  # type: ignore[no-untyped-call]
+        voices = await asyncio.get_event_loop().run_in_executor(
+            self._tts_pool, self.engine.getProperty, 'voices'
+        )
         return [
             {
                 "id": voice.id,  # type: ignore[union-attr]
@@ -186,37 +439,21 @@ class VoiceService:
             # Apply legal-specific formatting
             text = result["text"]
 
-            # Detect and format legal citations
-            import re
-
             # Format case citations (e.g., "Smith v Jones 2023")
-            text = re.sub(
-                r'(\w+) versus (\w+) (\d{4})',
-                r'\1 v \2 [\3]',
-                text,
-                flags=re.IGNORECASE
-            )
+            text = _CASE_CITE_RE.sub(r'\1 v \2 [\3]', text)
 
             # Format section references
-            text = re.sub(
-                r'section (\d+)',
-                r'Section \1',
-                text,
-                flags=re.IGNORECASE
-            )
+            text = _SECTION_RE.sub(r'Section \1', text)
 
             # Format act references
-            text = re.sub(
-                r'(\w+) act (\d{4})',
-                lambda m: f'{m.group(1).title()} Act {m.group(2)}',
-                text,
-                flags=re.IGNORECASE
-            )
+            text = _ACT_RE.sub(lambda m: f'{m.group(1).title()} Act {m.group(2)}', text)
 
             result["formatted_text"] = text
 
         return result
 
 
-# Singleton instance
-voice_service = VoiceService()
+@functools.cache
+def get_voice_service() -> VoiceService:
+    """Get the shared VoiceService, created on first use so importing this module does not start the TTS engine"""
+    return VoiceService()
@@ -3,13 +3,20 @@ Bug reporting system for Solicitor Brain
 Integrates with VS Code problem matcher and logs
 """
 
+import atexit
 import json
 import logging
+import threading
 import traceback
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Configure logger
 logger = logging.getLogger("bug_reporter")
 
@@ -21,6 +28,12 @@ class BugReporter:
         self.log_dir = Path("logs")
         self.log_dir.mkdir(exist_ok=True)
 
+        # Append-only NDJSON error log, reopened when the UTC date changes
+        self._bug_log: Any = None
+        self._bug_log_day = ""
+        self._bug_log_lock = threading.Lock()
+        atexit.register(self.close)
+
         # VS Code problem matcher format
         self.setup_vscode_logger()
 
@@ -84,10 +97,34 @@ class BugReporter:
         return error_report
 
     def save_error_report(self, report: dict[str, Any]):
-        """Save error report to file"""
-        error_file = self.log_dir / f"error_{report['id'].replace(':', '-')}.json"
-        with open(error_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        """Append error report to the day's NDJSON log"""
+        if orjson is not None:
+            line = orjson.dumps(report) + b"\n"
+        else:
+            line = json.dumps(report, separators=(",", ":")).encode() + b"\n"
+
+        day = datetime.now(UTC).strftime('%Y%m%d')
+        with self._bug_log_lock:
+            if day != self._bug_log_day:
+                # Close the previous day's file before rolling over to the new one
+                self._close_bug_log()
+                self._bug_log = open(self.log_dir / f"errors_{day}.ndjson", "ab", buffering=64 * 1024)
+                self._bug_log_day = day
+            self._bug_log.write(line)
+            # One write syscall per report; flushed so a crash does not lose the reports leading up to it
+            self._bug_log.flush()
+
+    def _close_bug_log(self) -> None:
+        """Flush and close the open NDJSON log; callers hold _bug_log_lock"""
+        if self._bug_log is not None:
+            self._bug_log.close()
+            self._bug_log = None
+            self._bug_log_day = ""
+
+    def close(self) -> None:
+        """Flush and close the error log; registered with atexit so buffered reports reach disk"""
+        with self._bug_log_lock:
+            self._close_bug_log()
 
     def report_warning(self, message: str, context: dict[str, Any] | None = None):  # noqa: ARG002
         """Report a warning"""
@@ -1,15 +1,37 @@
+import asyncio
+import contextlib
+import functools
 import hashlib
 import json
 import logging
+import socket
 import time
+import weakref
 from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+try:
+    import ahocorasick  # type: ignore[import-untyped]
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+
+try:
+    import blake3  # type: ignore[import-untyped]
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from backend.config import settings
 from backend.services.monitoring import (
+    record_audit_entry_dropped,
     record_citation_check,
     record_request_duration,
     record_sign_off,
@@ -17,8 +39,71 @@ from backend.services.monitoring import (
 
 logger = logging.getLogger(__name__)
 
+# Audit entries waiting for the background writer, and how many it takes off the queue per wake-up
+AUDIT_QUEUE_SIZE = 10000
+AUDIT_BATCH_SIZE = 100
+
+# Per-request audit fields, in the order they are queued and written
+AUDIT_FIELDS = ("timestamp", "method", "path", "status", "duration", "client", "user_agent")
+AuditEntry = tuple[str, str, str, int, float, str, str]
+
+
+def _json_value(value: Any) -> bytes:
+    """Serialise a single JSON value"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode()
+
+
+# Fields shared by every audit entry, serialised once; each entry's own fields are appended after it
+_AUDIT_PREFIX = b'{"service":"solicitor-brain","host":' + _json_value(socket.gethostname())
+_AUDIT_KEYS = tuple(f',"{name}":'.encode() for name in AUDIT_FIELDS)
+
+
+def _integrity_hash(payload: bytes) -> tuple[str, str]:
+    """Hash an audit payload as (algorithm, hex digest); BLAKE3 is truncated to 128 bits"""
+    if blake3 is not None and settings.audit_hash_algorithm == "blake3":
+        return "blake3", blake3.blake3(payload).hexdigest(16)
+    return "sha256", hashlib.sha256(payload).hexdigest()
+
+
+@functools.cache
+def _domain_automaton(domains: tuple[str, ...]) -> Any:
+    """Aho-Corasick automaton over the allowed citation domains"""
+    if ahocorasick is None or not domains:
+        return None
+    automaton = ahocorasick.Automaton()  # type: ignore[union-attr]
+    for domain in domains:
+        automaton.add_word(domain, domain)
+    automaton.make_automaton()
+    return automaton
+
+
+def _has_allowed_domain(source: str) -> bool:
+    """Whether the source contains any allowed citation domain, in one pass over the source"""
+    automaton = _domain_automaton(tuple(settings.allowed_citation_domains))
+    if automaton is not None:
+        return next(automaton.iter(source), None) is not None
+    return any(domain in source for domain in settings.allowed_citation_domains)
+
+
+def _audit_line(entry: AuditEntry) -> str:
+    """Format an audit entry as JSON with its integrity hash appended"""
+    # The hash covers the object as written, up to the hash fields; it is serialised only once
+    payload = _AUDIT_PREFIX + b"".join(key + _json_value(value) for key, value in zip(_AUDIT_KEYS, entry)) + b"}"
+    hash_alg, log_hash = _integrity_hash(payload)
+    return f'AUDIT: {payload[:-1].decode()},"hash":"{log_hash}","hash_alg":"{hash_alg}"}}'
+
 
 class ComplianceMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        # Entries are hashed and logged by a background task so the response is not held up
+        self._audit_queue: asyncio.Queue[AuditEntry] = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._audit_task: asyncio.Task[None] | None = None
+        self._dropped = 0
+        _audit_middlewares.add(self)
+
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         start_time = time.time()
 
@@ -28,7 +113,7 @@ class ComplianceMiddleware(BaseHTTPMiddleware):
 
         # Log request for audit trail
         duration = time.time() - start_time
-        await self._log_request(request, response, duration)
+        self._log_request(request, response, duration)
 
         # Record metrics
         record_request_duration(
@@ -40,23 +125,71 @@ class ComplianceMiddleware(BaseHTTPMiddleware):
 
         return response
 
-    async def _log_request(self, request: Request, response: Response, duration: float) -> None:
-        # Create immutable audit log entry
-        log_entry: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "method": request.method,
-            "path": request.url.path,
-            "status": response.status_code,
-            "duration": duration,
-            "client": request.client.host if request.client else "unknown",
-            "user_agent": request.headers.get("user-agent", ""),
-        }
-
-        # Hash for integrity
-        log_hash = hashlib.sha256(json.dumps(log_entry, sort_keys=True).encode()).hexdigest()
-        log_entry["hash"] = log_hash
+    def _log_request(self, request: Request, response: Response, duration: float) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        # Create immutable audit log entry, in AUDIT_FIELDS order
+        log_entry: AuditEntry = (
+            datetime.now(UTC).isoformat(),
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration,
+            request.client.host if request.client else "unknown",
+            request.headers.get("user-agent", ""),
+        )
 
-        logger.info(f"AUDIT: {json.dumps(log_entry)}")
+        if self._audit_task is None or self._audit_task.done():
+            self._audit_task = asyncio.create_task(self._audit_writer())
+
+        # Under sustained overload drop the oldest entry rather than hold the response
+        if self._audit_queue.full():
+            self._audit_queue.get_nowait()
+            record_audit_entry_dropped()
+            if self._dropped == 0:
+                logger.warning("Audit queue full; dropping oldest audit entries")
+            self._dropped += 1
+        self._audit_queue.put_nowait(log_entry)
+
+    def _write_entries(self, entries: list[AuditEntry]) -> None:
+        """Log each audit entry as its own record"""
+        for entry in entries:
+            logger.info(_audit_line(entry))
+        if self._dropped and self._audit_queue.empty():
+            logger.warning(f"Dropped {self._dropped} audit entries while the audit queue was full")
+            self._dropped = 0
+
+    async def _audit_writer(self) -> None:
+        """Log queued audit entries, taking up to AUDIT_BATCH_SIZE off the queue per wake-up"""
+        while True:
+            entries = [await self._audit_queue.get()]
+            while len(entries) < AUDIT_BATCH_SIZE and not self._audit_queue.empty():
+                entries.append(self._audit_queue.get_nowait())
+            self._write_entries(entries)
+
+    async def close(self) -> None:
+        """Stop the writer task and log every entry still queued"""
+        if self._audit_task is not None:
+            # The writer only yields while waiting on an empty queue, so cancelling it never loses a batch
+            self._audit_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._audit_task
+            self._audit_task = None
+        entries = []
+        while not self._audit_queue.empty():
+            entries.append(self._audit_queue.get_nowait())
+        self._write_entries(entries)
+
+
+# Live middleware instances, so application shutdown can flush their audit queues
+_audit_middlewares: weakref.WeakSet[ComplianceMiddleware] = weakref.WeakSet()
+
+
+async def close_audit_log() -> None:
+    """Flush every ComplianceMiddleware's pending audit entries; call on application shutdown"""
+    for middleware in list(_audit_middlewares):
+        await middleware.close()
 
 
 def check_citation(text: str, citations: list[dict[str, Any]]) -> bool:
@@ -68,18 +201,15 @@ def check_citation(text: str, citations: list[dict[str, Any]]) -> bool:
         record_citation_check(success=False)
         return False
 
-    # Verify citation confidence
+    # Verify citation confidence and domain in a single pass
     for citation in citations:
         if citation.get("confidence", 0) < settings.min_citation_confidence:
             logger.warning(f"Low confidence citation: {citation}")
             record_citation_check(success=False)
             return False
 
-    # Verify citation domains
-    for citation in citations:
         source = citation.get("source", "")
-        valid_domain = any(domain in source for domain in settings.allowed_citation_domains)
-        if not valid_domain:
+        if not _has_allowed_domain(source):
             logger.warning(f"Invalid citation domain: {source}")
             record_citation_check(success=False)
             return False
@@ -88,6 +218,11 @@ def check_citation(text: str, citations: list[dict[str, Any]]) -> bool:
     return True
 
 
+def check_citations(items: list[tuple[str, list[dict[str, Any]]]]) -> list[bool]:
+    """Check a batch of (text, citations) pairs, e.g. from a worker thread"""
+    return [check_citation(text, citations) for text, citations in items]
+
+
 def validate_sign_off(document_id: str, status: str, user_id: str) -> bool:
     valid_statuses: list[Any] = ["suggested", "accepted", "amended", "rejected"]
 
@@ -6,7 +6,10 @@ Provides proper resource management throughout the application
 import asyncio
 import contextlib
 import os
+import select
+import shutil
 import signal
+import socket
 import subprocess
 import time
 from collections.abc import AsyncGenerator, Generator
@@ -14,8 +17,10 @@ from pathlib import Path
 from typing import Any
 
 import psutil
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.config import settings
+from backend.utils.db_context import asyncpg_connect_args
 
 try:
     import aiofiles
@@ -24,6 +29,26 @@ except ImportError:
 # import asyncpg  # Not used, removed to fix import warning
 
 
+def _wait_for_exit(process: subprocess.Popen[str], timeout: float) -> None:
+    """Wait for a process to exit, raising subprocess.TimeoutExpired after timeout"""
+    # A pidfd becomes readable the moment the child exits, so select() sleeps instead of Popen.wait() polling
+    if not hasattr(os, "pidfd_open"):
+        process.wait(timeout=timeout)
+        return
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except OSError:  # Already reaped, or a kernel without pidfd support
+        process.wait(timeout=timeout)
+        return
+    try:
+        ready, _, _ = select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    if not ready:
+        raise subprocess.TimeoutExpired(process.args, timeout)
+    process.wait()
+
+
 class ProcessManager:
     """Context manager for subprocess management with proper cleanup"""
 
@@ -42,8 +67,8 @@ class ProcessManager:
 
     def __enter__(self) -> subprocess.Popen[str]:
         """Start the process"""
-        process_env = os.environ.copy()
-        process_env.update(self.env)
+        # Inherit the environment as-is unless there are overrides, which are merged in one pass
+        process_env = {**os.environ, **self.env} if self.env else None
 
         self.process = subprocess.Popen(
             self.cmd,
@@ -74,7 +99,7 @@ class ProcessManager:
 
                 # Wait for graceful shutdown
                 try:
-                    self.process.wait(timeout=5)
+                    _wait_for_exit(self.process, timeout=5)
                 except subprocess.TimeoutExpired:
                     # Force kill if needed
                     if os.name != "nt":
@@ -99,21 +124,21 @@ class DatabaseManager:
     def __init__(self, database_url: str):
         self.database_url = database_url
         self.engine: AsyncEngine | None = None
-        self.async_session_maker = None
+        self.async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
     async def __aenter__(self) -> "DatabaseManager":
         """Create engine and session maker"""
         self.engine = create_async_engine(
             self.database_url,
             echo=False,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_pre_ping=False,
+            pool_recycle=settings.db_pool_recycle,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            connect_args=asyncpg_connect_args(self.database_url),
         )
 
-        self.async_session_maker = sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False  # type: ignore[arg-type]
-        )  # type: ignore[call-overload]
+        self.async_session_maker = async_sessionmaker(self.engine, expire_on_commit=False, autoflush=False)
         return self
 
     async def __aexit__(
@@ -132,12 +157,12 @@ class DatabaseManager:
         async with self.async_session_maker() as session:  # type: ignore[misc]
             try:
                 yield session
-                await session.commit()  # type: ignore[attr-defined]
+                await session.commit()
             except Exception:
-                await session.rollback()  # type: ignore[attr-defined]
+                await session.rollback()
                 raise
             finally:
-                await session.close()  # type: ignore[attr-defined]
+                await session.close()
 
 
 @contextlib.asynccontextmanager
@@ -162,30 +187,70 @@ async def managed_file(filepath: Path, mode: str = "r", **kwargs: Any) -> AsyncG
         yield file
 
 
+def _port_in_use(port: int) -> bool:
+    """Probe a port by binding to it on all IPv4 and IPv6 interfaces, so a listener on any address fails the bind"""
+    families = (socket.AF_INET, socket.AF_INET6) if socket.has_ipv6 else (socket.AF_INET,)
+    for family in families:
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            # IPv6 compiled in but disabled on this host
+            continue
+        with sock:
+            if os.name == "nt":
+                # SO_REUSEADDR on Windows lets the bind succeed over a live listener; exclusive use makes it fail
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)  # type: ignore[attr-defined]
+            else:
+                # Ignore TIME_WAIT leftovers; only a live listener makes the bind fail
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("", port))
+            except OSError:
+                return True
+    return False
+
+
+def _port_owner_pids(port: int) -> set[int]:
+    """PIDs holding the port, via a targeted lsof query when available, else a full socket scan"""
+    if shutil.which("lsof"):
+        result = subprocess.run(
+            ["lsof", "-t", f"-iTCP:{port}", "-sTCP:LISTEN"], capture_output=True, text=True, check=False
+        )
+        return {int(pid) for pid in result.stdout.split()}
+    return {
+        conn.pid
+        for conn in psutil.net_connections()
+        if hasattr(conn, "laddr") and conn.laddr and conn.laddr.port == port and conn.pid
+    }
+
+
 @contextlib.contextmanager
 def port_manager(port: int) -> Generator[None, None, None]:
     """Context manager to ensure a port is free before and after use"""
 
-    def kill_port(port_num: int):
-        """Kill any process using the specified port"""
+    def kill_port(port_num: int) -> bool:
+        """Kill any process using the specified port; returns whether the port was in use"""
         try:
-            for conn in psutil.net_connections():
-                if hasattr(conn, "laddr") and conn.laddr and conn.laddr.port == port_num and conn.pid:
+            # Binding is far cheaper than the owner lookup, so a free port returns straight away
+            if not _port_in_use(port_num):
+                return False
+            for pid in _port_owner_pids(port_num):
+                try:
+                    proc = psutil.Process(pid)
+                    proc.terminate()
                     try:
-                        proc = psutil.Process(conn.pid)
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=5)
-                        except psutil.TimeoutExpired:
-                            proc.kill()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                        proc.wait(timeout=5)
+                    except psutil.TimeoutExpired:
+                        proc.kill()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
         except Exception:
             pass
+        return True
 
-    # Kill any existing process on the port
-    kill_port(port)
-    time.sleep(0.5)
+    # Kill any existing process on the port, giving the OS a moment to release it
+    if kill_port(port):
+        time.sleep(0.5)
 
     try:
         yield
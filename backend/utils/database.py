@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from collections.abc import AsyncGenerator
 
 from sqlalchemy import select
@@ -6,14 +8,30 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import declarative_base
 
 from backend.config import settings
+from backend.utils.db_context import FastAsyncSession, asyncpg_connect_args, warm_pool
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True, pool_size=10, max_overflow=20)
+# Seconds a successful health probe is trusted before the database is queried again
+HEALTH_TTL = 2.0
+
+_last_healthy_at: float | None = None
+_health_lock = asyncio.Lock()
+
+# Connections are replaced by age rather than pinged with SELECT 1 on every checkout
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_pre_ping=False,
+    pool_recycle=settings.db_pool_recycle,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    connect_args=asyncpg_connect_args(settings.database_url, command_timeout=settings.db_command_timeout),
+)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=FastAsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -27,17 +45,26 @@ async def init_db():
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await warm_pool(engine, settings.db_pool_min_size)
     logger.info("Database initialized")
 
 
 async def check_db_connection() -> bool:
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute(select(1))
+    """Report database health, reusing a success from the last HEALTH_TTL seconds; failures are never cached"""
+    global _last_healthy_at
+    async with _health_lock:
+        # Concurrent health checks share one probe instead of each borrowing a connection
+        if _last_healthy_at is not None and time.monotonic() - _last_healthy_at < HEALTH_TTL:
+            return True
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(select(1))
+        except Exception as e:
+            _last_healthy_at = None
+            logger.error(f"Database connection check failed: {e}")
+            return False
+        _last_healthy_at = time.monotonic()
         return True
-    except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
-        return False
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -6,10 +6,8 @@ from pathlib import Path
 from typing import Any
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 # Get app data directory
 if os.environ.get('ELECTRON_APP_DATA'):
@@ -33,16 +31,21 @@ DATABASE_URL = f"sqlite:///{DB_DIR / 'solicitor_brain.db'}"
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
-    poolclass=StaticPool,  # Better for desktop apps
-    echo=False
+    echo=False  # Default QueuePool: one connection per thread, so WAL readers run concurrently
 )
 
-# Enable foreign keys for SQLite
-@event.listens_for(Engine, "connect")
+# Enable foreign keys and tune each new SQLite connection
+@event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.execute("PRAGMA journal_mode=WAL")  # Better performance
+    cursor.execute("PRAGMA synchronous=NORMAL")  # No corruption risk under WAL; fsyncs at checkpoints, not every commit
+    cursor.execute("PRAGMA cache_size=-262144")  # 256 MB page cache (negative = KiB)
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # Read pages straight from a 256 MB memory map
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")
+    cursor.execute("PRAGMA busy_timeout=5000")  # Wait for a concurrent writer instead of failing with SQLITE_BUSY
     cursor.close()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -3,24 +3,85 @@ Database context managers for Solicitor Brain
 Provides async context managers for database operations
 """
 
+import asyncio
+import json
 import logging
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import JSON, Table, insert, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock acquisition: lock_timeout is set for the current transaction only, then the lock is awaited
+_ADVISORY_LOCK = text("SELECT set_config('lock_timeout', :timeout, true), pg_advisory_lock(:lock_id)")
+_ADVISORY_XACT_LOCK = text("SELECT set_config('lock_timeout', :timeout, true), pg_advisory_xact_lock(:lock_id)")
+_ADVISORY_UNLOCK = text("SELECT pg_advisory_unlock(:lock_id)")
+
+# Engine behind read_only_session, shared across calls so its small pool is actually reused
+_read_only_engine: AsyncEngine | None = None
+_read_only_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+class FastAsyncSession(AsyncSession):
+    """AsyncSession that remembers the driver connection behind its current transaction"""
+
+    _raw: tuple[Any, Any] | None = None
+
+    async def raw(self) -> Any:
+        """Driver-level connection (asyncpg.Connection on PostgreSQL) for COPY and other protocol calls"""
+        connection = await self.connection()
+        # Reuse the cached handle while the session is still on the same pooled connection
+        if self._raw is None or self._raw[0] is not connection.sync_connection:
+            raw_connection = await connection.get_raw_connection()
+            self._raw = (connection.sync_connection, raw_connection.driver_connection)
+        return self._raw[1]
+
+    async def close(self) -> None:
+        self._raw = None
+        await super().close()
+
+
+def asyncpg_connect_args(database_url: str, **overrides: Any) -> dict[str, Any]:
+    """Connection arguments shared by every asyncpg engine: statement caches sized from settings, JIT off"""
+    if not database_url.startswith("postgresql+asyncpg"):
+        return {}
+    return {
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+        "server_settings": {"jit": "off", "application_name": settings.db_application_name},
+        **overrides,
+    }
+
+
+async def warm_pool(engine: AsyncEngine, count: int) -> None:
+    """Open up to count pooled connections concurrently so the first requests skip connect and auth"""
+
+    async def open_connection() -> None:
+        async with engine.connect():
+            pass
+
+    try:
+        await asyncio.gather(*(open_connection() for _ in range(min(count, settings.db_pool_size))))
+    except Exception as e:
+        # Connection errors surface on first use, as they did before warming
+        logger.warning(f"Could not pre-warm database pool: {e}")
+
 
 class DatabaseSessionManager:
     """Manages database sessions with proper lifecycle"""
@@ -39,10 +100,14 @@ class DatabaseSessionManager:
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
             pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_use_lifo=settings.db_pool_use_lifo,
+            pool_reset_on_return="rollback",
+            connect_args=asyncpg_connect_args(self.database_url),
         )
+        await warm_pool(self._engine, settings.db_pool_min_size)
 
         self._sessionmaker = async_sessionmaker(
-            bind=self._engine, expire_on_commit=False, autoflush=False, autocommit=False
+            bind=self._engine, class_=FastAsyncSession, expire_on_commit=False, autoflush=False, autocommit=False
         )
 
         logger.info("Database session manager initialized")
@@ -58,6 +123,7 @@ class DatabaseSessionManager:
         if self._engine:
             await self._engine.dispose()
             logger.info("Database connections closed")
+        await dispose_read_only_engine()
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -81,6 +147,26 @@ class DatabaseSessionManager:
         async with self.session() as session, session.begin():
             yield session
 
+    @asynccontextmanager
+    async def pipelined_transaction(self) -> AsyncGenerator[Callable[..., None], None]:
+        """Transaction for independent raw-SQL writes, sent on exit as one pipelined executemany per statement
+
+        Yields add(query, *args) taking asyncpg $n placeholders. Writes are grouped by statement, so their
+        order across different statements is not kept; use it only for writes that do not depend on each other.
+        """
+        pending: dict[str, list[tuple[Any, ...]]] = {}
+
+        def add(query: str, *args: Any) -> None:
+            pending.setdefault(query, []).append(args)
+
+        async with self.transaction() as session:
+            yield add
+            if pending:
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                for query, args_list in pending.items():
+                    await raw_connection.driver_connection.executemany(query, args_list)  # type: ignore[union-attr]
+
 
 # Global database manager instance
 db_manager = DatabaseSessionManager()
@@ -111,50 +197,193 @@ async def transactional_session() -> AsyncGenerator[AsyncSession, None]:
 # Utility context managers for common patterns
 
 
+def copy_json(value: Any) -> str | None:
+    """Encode a JSON column value for binary COPY, where asyncpg's json codec takes text rather than Python objects"""
+    if value is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _item_value(item: Any, key: str) -> Any:
+    """Value of a column on a row dict or model, None when it is missing"""
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, key, None)
+
+
+def _record_keys(table: Table, columns: Sequence[str] | None, first: Any) -> list[str]:
+    """Columns a bulk load writes: the explicit list, else every column except database-generated ones
+    (server defaults, the autoincrement key) that the first item leaves unset"""
+    if columns:
+        return list(columns)
+    if isinstance(first, tuple):
+        return [column.key for column in table.columns]
+    return [
+        column.key
+        for column in table.columns
+        if (column.server_default is None and column is not table.autoincrement_column)
+        or _item_value(first, column.key) is not None
+    ]
+
+
+def _client_defaults(table: Table, keys: Sequence[str]) -> dict[str, Any]:
+    """Python-side column defaults (scalars or callables) for the written columns, which COPY never applies"""
+    defaults: dict[str, Any] = {}
+    for key in keys:
+        default = table.c[key].default
+        if default is not None and (default.is_scalar or default.is_callable):  # type: ignore[union-attr]
+            defaults[key] = default.arg  # type: ignore[union-attr]
+    return defaults
+
+
+def _as_record(item: Any, keys: Sequence[str], defaults: dict[str, Any]) -> tuple[Any, ...]:
+    """Reduce a tuple, row dict or model to a plain tuple in key order, dropping any ORM state; unset
+    values take the column's client-side default"""
+    if isinstance(item, tuple):
+        return item
+    record = []
+    for key in keys:
+        value = _item_value(item, key)
+        if value is None and key in defaults:
+            default = defaults[key]
+            # SQLAlchemy wraps callable defaults to take an execution context, which none of ours use
+            value = default(None) if callable(default) else default
+        record.append(value)
+    return tuple(record)
+
+
+async def _flush_records(
+    session: AsyncSession,
+    table: Table,
+    keys: Sequence[str],
+    records: list[tuple[Any, ...]],
+    skip_duplicates: bool,
+) -> None:
+    """Write buffered row tuples, streaming them with COPY on asyncpg"""
+    dialect = session.get_bind().dialect
+    if skip_duplicates:
+        # Junction-style rows: one INSERT ... ON CONFLICT DO NOTHING instead of a check per row
+        dialect_insert = postgresql.insert if dialect.name == "postgresql" else sqlite.insert
+        await session.execute(
+            dialect_insert(table).on_conflict_do_nothing(), [dict(zip(keys, record)) for record in records]
+        )
+        return
+
+    if dialect.driver == "asyncpg":
+        # copy_records_to_table streams the binary COPY format, so values go over the wire in their native encoding;
+        # only JSON columns need converting first
+        json_positions = [i for i, key in enumerate(keys) if isinstance(table.c[key].type, JSON)]
+        if json_positions:
+            records = [
+                tuple(copy_json(value) if i in json_positions else value for i, value in enumerate(record))
+                for record in records
+            ]
+        if isinstance(session, FastAsyncSession):
+            driver_connection = await session.raw()
+        else:
+            connection = await session.connection()
+            driver_connection = (await connection.get_raw_connection()).driver_connection
+        await driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            table.name, records=records, columns=[table.c[key].name for key in keys], schema_name=table.schema
+        )
+        return
+
+    # Other drivers (psycopg, aiosqlite): an executemany of plain rows, which SQLAlchemy renders as
+    # multi-row INSERT ... VALUES pages (insertmanyvalues) without the unit-of-work overhead
+    await session.execute(insert(table), [dict(zip(keys, record)) for record in records])
+
+
 @asynccontextmanager
 async def bulk_insert_context(
-    session: AsyncSession, batch_size: int = 1000
+    session: AsyncSession,
+    flush_every: int | None = None,
+    table: Table | None = None,
+    columns: Sequence[str] | None = None,
+    skip_duplicates: bool = False,
 ) -> AsyncGenerator[Callable[[Any], Awaitable[None]], None]:
-    """Context manager for efficient bulk inserts"""
-    items: list[Any] = []
+    """Context manager for efficient bulk inserts
+
+    Given a table, items may be tuples (in the order of columns), row dicts or models; each is reduced
+    to a plain tuple as it is added, so large loads buffer no ORM state. Unset values take the column's
+    Python-side default, as a flush would. Batches are loaded with
+    PostgreSQL COPY (asyncpg's copy_records_to_table) or, on other drivers, a multi-row INSERT; both
+    bypass the ORM, so models written this way are not added to the session. With skip_duplicates,
+    rows are inserted with ON CONFLICT DO NOTHING (PostgreSQL or SQLite). Without a table, models go
+    through add_all. Items are written in one batch on exit; set flush_every to bound memory.
+    """
+    objects: list[Any] = []
+    records: list[tuple[Any, ...]] = []
+    keys: list[str] = []
+    defaults: dict[str, Any] = {}
+
+    async def flush() -> None:
+        if table is None:
+            # SQLAlchemy 2.0 flushes same-class objects as one batched INSERT ... RETURNING, which also
+            # fetches server defaults, so no per-object refresh is needed afterwards
+            session.add_all(objects)
+            await session.flush()
+            objects.clear()
+        else:
+            await _flush_records(session, table, keys, records, skip_duplicates)
+            records.clear()
 
     async def add_item(item: Any) -> None:
-        items.append(item)
-        if len(items) >= batch_size:
-            session.add_all(items)
-            await session.flush()
-            items.clear()
+        if table is None:
+            objects.append(item)
+        else:
+            if not keys:
+                keys.extend(_record_keys(table, columns, item))
+                defaults.update(_client_defaults(table, keys))
+            records.append(_as_record(item, keys, defaults))
+        if flush_every is not None and len(objects) + len(records) >= flush_every:
+            await flush()
 
     try:
         yield add_item
     finally:
         # Insert remaining items
-        if items:
-            session.add_all(items)
-            await session.flush()
+        if objects or records:
+            await flush()
+
+
+def _get_read_only_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the shared read-only engine, creating both on first use"""
+    global _read_only_engine, _read_only_sessionmaker
+    if _read_only_sessionmaker is None:
+        _read_only_engine = create_async_engine(
+            settings.database_url,
+            echo=False,
+            pool_size=2,  # Small pool for reports/analytics
+            max_overflow=0,
+            pool_use_lifo=settings.db_pool_use_lifo,
+            pool_reset_on_return="rollback",
+            connect_args=asyncpg_connect_args(settings.database_url, command_timeout=60),
+        )
+        _read_only_sessionmaker = async_sessionmaker(
+            bind=_read_only_engine, class_=FastAsyncSession, expire_on_commit=False, autoflush=False, autocommit=False
+        )
+    return _read_only_sessionmaker
+
+
+async def dispose_read_only_engine() -> None:
+    """Close the shared read-only engine's connections"""
+    global _read_only_engine, _read_only_sessionmaker
+    if _read_only_engine is not None:
+        await _read_only_engine.dispose()
+        _read_only_engine = None
+        _read_only_sessionmaker = None
 
 
 @asynccontextmanager
 async def read_only_session() -> AsyncGenerator[AsyncSession, None]:
     """Get a read-only database session (useful for reports/analytics)"""
-    engine = create_async_engine(
-        settings.database_url,
-        echo=False,
-        poolclass=NullPool,  # No connection pooling for read-only
-        connect_args={
-            "server_settings": {"jit": "off"},
-            "command_timeout": 60,
-        },
-    )
-
-    factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False, autocommit=False)
-
-    async with factory() as session:
+    async with _get_read_only_sessionmaker()() as session:
         try:
             yield session
         finally:
             await session.close()
-            await engine.dispose()
 
 
 @asynccontextmanager
@@ -163,24 +392,30 @@ async def database_lock(session: AsyncSession, lock_id: int, timeout: int = 10):
     PostgreSQL advisory lock context manager
     Useful for preventing concurrent operations
     """
-    # Try to acquire lock
-    result = await session.execute(text(f"SELECT pg_try_advisory_lock({lock_id})"))
-    locked = result.scalar()
-
-    if not locked:
-        # Wait for lock with timeout
-        await session.execute(text(f"SET lock_timeout = '{timeout}s'"))
-        try:
-            await session.execute(text(f"SELECT pg_advisory_lock({lock_id})"))
-            locked = True
-        except Exception as e:
-            raise TimeoutError(f"Could not acquire lock {lock_id}: {e}")
+    # Set a transaction-local lock_timeout and wait for the lock in one round-trip
+    try:
+        await session.execute(_ADVISORY_LOCK, {"timeout": f"{timeout}s", "lock_id": lock_id})
+    except Exception as e:
+        raise TimeoutError(f"Could not acquire lock {lock_id}: {e}")
 
     try:
         yield
     finally:
-        if locked:
-            await session.execute(text(f"SELECT pg_advisory_unlock({lock_id})"))
+        await session.execute(_ADVISORY_UNLOCK, {"lock_id": lock_id})
+
+
+@asynccontextmanager
+async def database_xact_lock(session: AsyncSession, lock_id: int, timeout: int = 10):
+    """
+    Transaction-scoped PostgreSQL advisory lock
+    Released by PostgreSQL on commit or rollback, so there is no unlock round-trip
+    """
+    try:
+        await session.execute(_ADVISORY_XACT_LOCK, {"timeout": f"{timeout}s", "lock_id": lock_id})
+    except Exception as e:
+        raise TimeoutError(f"Could not acquire lock {lock_id}: {e}")
+
+    yield
 
 
 # Example usage patterns:
@@ -204,6 +439,13 @@ async def import_documents(documents: List[dict]):
                 doc = Document(**doc_data)
                 await add_doc(doc)
 
+# Large loads streamed with COPY
+async def load_documents(rows: List[dict]):
+    async with transactional_session() as session:
+        async with bulk_insert_context(session, table=Document.__table__) as add_row:
+            for row in rows:
+                await add_row(row)
+
 # Complex transactions
 async def transfer_case(case_id: int, new_solicitor_id: int):
     async with db_manager.transaction() as session:
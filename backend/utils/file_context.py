@@ -4,11 +4,13 @@ Provides safe file handling with automatic cleanup
 """
 
 import asyncio
+import contextlib
 import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import time
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
@@ -18,8 +20,35 @@ from typing import Any, TextIO
 import aiofiles
 import aiofiles.os
 
+try:
+    from watchfiles import awatch  # type: ignore[import-not-found]
+except ImportError:
+    awatch = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# How often a lock waiter re-checks the lock file when no file event arrives. A release between the failed
+# O_EXCL open and the watch being registered produces no event, so this bounds that wait as the old poll did
+LOCK_RECHECK_MS = 100
+# Longest sleep between non-blocking attempts while locked_file waits on a contended lock
+LOCKED_FILE_MAX_BACKOFF = 0.05
+
+
+def _file_sha256(filepath: Path) -> str:
+    """SHA-256 of a file, streamed through hashlib so large files are never held in memory"""
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _link_backup(filepath: Path, backup_file: Path) -> None:
+    """Keep the current file as a backup by hard-linking it, falling back to a copy where links are unsupported"""
+    # The original inode is only ever replaced by rename, never written to, so a link preserves its contents
+    backup_file.unlink(missing_ok=True)
+    try:
+        os.link(filepath, backup_file)
+    except OSError:
+        shutil.copy2(filepath, backup_file)
+
 
 @contextmanager
 def safe_file_write(
@@ -45,7 +74,7 @@ def safe_file_write(
         # Create backup if requested and file exists
         if backup and filepath.exists():
             backup_file = filepath.with_suffix(f"{filepath.suffix}.backup")
-            shutil.copy2(filepath, backup_file)
+            _link_backup(filepath, backup_file)
 
         # Write to temporary file first
         temp_fd, temp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
@@ -123,34 +152,26 @@ def locked_file(filepath: str | Path, mode: str = "r+", timeout: float = 10.0) -
         timeout: Lock timeout in seconds
     """
     import fcntl
-    import signal
 
     filepath = Path(filepath)
 
-    class TimeoutError(Exception):
-        pass
-
-    def timeout_handler(signum: int, frame: Any) -> None:
-        raise TimeoutError(f"Could not acquire lock on {filepath}")
-
-    # Set timeout alarm
-    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(int(timeout))
-
-    try:
-        with open(filepath, mode) as f:
-            # Acquire exclusive lock
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-
-            # Cancel alarm
-            signal.alarm(0)
-
-            yield f  # type: ignore[misc]
-
-    finally:
-        # Restore old handler
-        signal.signal(signal.SIGALRM, old_handler)
-        signal.alarm(0)
+    with open(filepath, mode) as f:
+        # Non-blocking attempts with a deadline rather than SIGALRM, which only works on the main thread;
+        # flock locks belong to this open file description, so threads in one process exclude each other too
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while True:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Could not acquire lock on {filepath}") from None
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, LOCKED_FILE_MAX_BACKOFF)
+
+        yield f  # type: ignore[misc]
 
 
 @contextmanager
@@ -171,6 +192,24 @@ def temp_directory(prefix: str = "solicitor_brain_", cleanup: bool = True) -> Ge
             shutil.rmtree(temp_dir)
 
 
+async def _wait_for_unlock(lockfile: Path) -> None:
+    """Return once the lock file is gone; woken by file events where watchfiles is available, else a short sleep"""
+    if awatch is None:
+        await asyncio.sleep(0.1)
+        return
+
+    name = lockfile.name
+    async for _ in awatch(
+        lockfile.parent,
+        watch_filter=lambda _change, path: os.path.basename(path) == name,
+        step=1,
+        rust_timeout=LOCK_RECHECK_MS,
+        yield_on_timeout=True,
+    ):
+        if not lockfile.exists():
+            return
+
+
 @asynccontextmanager
 async def file_lock(lockfile: str | Path, timeout: float = 30.0) -> AsyncGenerator[None, None]:
     """
@@ -192,11 +231,13 @@ async def file_lock(lockfile: str | Path, timeout: float = 30.0) -> AsyncGenerat
             break
         except FileExistsError:
             # Check timeout
-            if asyncio.get_event_loop().time() - start_time > timeout:
+            remaining = timeout - (asyncio.get_event_loop().time() - start_time)
+            if remaining <= 0:
                 raise TimeoutError(f"Could not acquire lock: {lockfile}")
 
-            # Wait and retry
-            await asyncio.sleep(0.1)
+            # Wait for the holder to release it, then retry
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(_wait_for_unlock(lockfile), remaining)
 
     try:
         yield
@@ -208,21 +249,29 @@ async def file_lock(lockfile: str | Path, timeout: float = 30.0) -> AsyncGenerat
 class FileWatcher:
     """Context manager for watching file changes"""
 
-    def __init__(self, filepath: str | Path):
+    def __init__(self, filepath: str | Path, verify_content: bool = False):
         self.filepath = Path(filepath)
+        self.verify_content = verify_content
         self.initial_mtime = None
         self.initial_size = None
+        self.initial_signature: tuple[int, int, int, int, int] | None = None
         self.initial_hash = None
 
+    @staticmethod
+    def _signature(stat: os.stat_result) -> tuple[int, int, int, int, int]:
+        """rsync/git-style quick check: any write or replacement changes one of these"""
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ctime_ns, stat.st_ino, stat.st_dev)
+
     def __enter__(self):
         if self.filepath.exists():
             stat = self.filepath.stat()
             self.initial_mtime = stat.st_mtime
             self.initial_size = stat.st_size
+            self.initial_signature = self._signature(stat)
 
             # Calculate hash for content verification
-            with open(self.filepath, "rb") as f:
-                self.initial_hash = hashlib.sha256(f.read()).hexdigest()
+            if self.verify_content:
+                self.initial_hash = _file_sha256(self.filepath)
 
         return self
 
@@ -242,27 +291,28 @@ class FileWatcher:
 
         stat = self.filepath.stat()
 
-        # Quick checks
-        if stat.st_mtime != self.initial_mtime:
-            return True
-        if stat.st_size != self.initial_size:
+        # Quick check: identical stat signature means unchanged, one stat() and no read
+        if self._signature(stat) == self.initial_signature:
+            return False
+        if not self.verify_content or stat.st_size != self.initial_size:
             return True
 
-        # Content check
-        with open(self.filepath, "rb") as f:
-            current_hash = hashlib.sha256(f.read()).hexdigest()
-
-        return current_hash != self.initial_hash
+        # Metadata moved (e.g. touched); with verify_content only a content difference counts
+        return _file_sha256(self.filepath) != self.initial_hash
 
 
 @contextmanager
-def atomic_write(filepath: str | Path, mode: str = "w", **kwargs: Any) -> Generator[TextIO, None, None]:
+def atomic_write(
+    filepath: str | Path, mode: str = "w", durable: bool = False, overwrite: bool = True, **kwargs: Any
+) -> Generator[TextIO, None, None]:
     """
     Write file atomically - file appears all at once or not at all
 
     Args:
         filepath: Target file path
         mode: Write mode
+        durable: fsync the data and the directory entry so the write survives a crash
+        overwrite: Replace an existing file; when False raise FileExistsError instead
         **kwargs: Additional arguments for open()
     """
     filepath = Path(filepath)
@@ -284,17 +334,32 @@ def atomic_write(filepath: str | Path, mode: str = "w", **kwargs: Any) -> Genera
         try:
             yield tmp_file  # type: ignore[misc]
 
-            # Ensure all data is written
-            tmp_file.flush()
-            os.fsync(tmp_file.fileno())
+            # Ensure all data is on disk before it becomes visible
+            if durable:
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
 
         except Exception:
             # Clean up on error
             temp_path.unlink(missing_ok=True)
             raise
 
-    # Atomic rename
-    temp_path.replace(filepath)
+    # Atomic rename; a hard link publishes the file only if the name is still free
+    if overwrite:
+        temp_path.replace(filepath)
+    else:
+        try:
+            os.link(temp_path, filepath)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    # The rename itself is only durable once the directory is synced
+    if durable:
+        dir_fd = os.open(filepath.parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 @asynccontextmanager
@@ -351,9 +416,9 @@ with safe_file_write('config.json') as f:
     json.dump(config, f)
 
 # Atomic writes
-with atomic_write('important.txt') as f:
+with atomic_write('important.txt', durable=True) as f:
     f.write("Critical data")
-    # File only appears after successful completion
+    # File only appears after successful completion, and survives a crash
 
 # File locking
 with locked_file('shared_resource.txt', 'r+') as f:
@@ -0,0 +1,31 @@
+"""
+Shared process pool for CPU-bound document work (PDF parsing, OCR, text analysis)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.config import settings
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _init_worker() -> None:
+    """Keep Tesseract single-threaded in workers; parallelism comes from the pool itself"""
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the application-wide process pool, creating it on first use"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=settings.ocr_max_workers, initializer=_init_worker)
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the process pool, cancelling queued work"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
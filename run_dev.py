@@ -4,25 +4,84 @@ Development runner for Solicitor Brain
 Consolidated master version with context managers and enhanced features
 """
 
+import http.client
+import importlib.metadata
 import os
+import re
+import signal
 import sys
 import subprocess
+import threading
 import time
 import psutil
 import webbrowser
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 import click
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from contextlib import ExitStack
 
+# Our service ports: backend, frontend, Ollama
+SERVICE_PORTS = (8000, 3000, 11434)
+PID_RE = re.compile(r"pid=(\d+)")
+REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# ANSI "clear screen, cursor home": written with the banner instead of running clear/cls
+CLEAR = "\x1b[2J\x1b[H"
+
+BANNER_START = """
+╔═══════════════════════════════════════════════════════════════════╗
+║                      SOLICITOR BRAIN v0.1.0                       ║
+║                   AI-Powered Legal Assistant                      ║
+╠═══════════════════════════════════════════════════════════════════╣
+║  🏃 Starting development environment...                           ║
+╚═══════════════════════════════════════════════════════════════════╝
+"""
+
+BANNER_READY = """
+╔═══════════════════════════════════════════════════════════════════╗
+║               🎉 SOLICITOR BRAIN IS RUNNING! 🎉                  ║
+╠═══════════════════════════════════════════════════════════════════╣
+║                                                                   ║
+║  📍 Access Points:                                                ║
+║  ├─ Frontend:     http://localhost:3000                          ║
+║  ├─ Backend API:  http://localhost:8000                          ║
+║  └─ API Docs:     http://localhost:8000/docs                     ║
+║                                                                   ║
+║  🔑 Development Credentials:                                      ║
+║  ├─ Email:    test@example.com                                   ║
+║  └─ Password: test                                               ║
+║                                                                   ║
+║  🛠️  VS Code Debugging:                                           ║
+║  1. Open VS Code: code .                                         ║
+║  2. Go to Run and Debug (Ctrl+Shift+D)                          ║
+║  3. Select 'Full Stack' and press F5                            ║
+║                                                                   ║
+╠═══════════════════════════════════════════════════════════════════╣
+║  ⚠️  AI outputs are organisational assistance only –              ║
+║     verify before use.                                           ║
+╚═══════════════════════════════════════════════════════════════════╝
+"""
+
 
 class DevRunner:
     def __init__(self) -> None:
         self.processes: List[Tuple[str, subprocess.Popen[str]]] = []
         self.root_dir = Path(__file__).parent
-        self.venv_path = self.root_dir / "venv"
+        # Virtualenv layout resolved once for this platform instead of probing both candidates
+        self.venv_path = self.root_dir / ".venv"
+        bin_dir = self.venv_path / ("Scripts" if os.name == "nt" else "bin")
+        self.venv_pip = bin_dir / ("pip.exe" if os.name == "nt" else "pip")
+        self.venv_python = bin_dir / ("python.exe" if os.name == "nt" else "python")
         self.exit_stack = ExitStack()
+        # Kept-alive connections for readiness probes, one per host:port, instead of a new TCP handshake per poll
+        self._probe_connections: Dict[str, http.client.HTTPConnection] = {}
+        # Resolve the default browser once; None on headless machines with nothing to open
+        try:
+            self._browser: Optional[webbrowser.BaseBrowser] = webbrowser.get()
+        except webbrowser.Error:
+            self._browser = None
 
     def check_requirements(self) -> bool:
         """Check if all requirements are met"""
@@ -34,28 +93,22 @@ class DevRunner:
             return False
 
         # Check if venv exists
-        venv_path = self.root_dir / ".venv"
-        if not venv_path.exists():
+        if not self.venv_path.exists():
             print("📦 Creating virtual environment...")
             subprocess.run([sys.executable, "-m", "venv", ".venv"], check=True)
 
-        # Install requirements
-        pip_path = venv_path / "bin" / "pip"
-        if not pip_path.exists():
-            pip_path = venv_path / "Scripts" / "pip.exe"  # Windows
-
         print("📦 Checking Python dependencies...")
-        # Only install if needed
+        # Only install if needed; reading package metadata avoids importing (and executing) the packages
         try:
-            import fastapi
-            import uvicorn
-            import psutil as psutil_check
-            # Verify imports are working
-            _ = (fastapi.__version__, uvicorn.__version__, psutil_check.__version__)
+            for package in ("fastapi", "uvicorn", "psutil"):
+                importlib.metadata.version(package)
             print("✓ Dependencies already installed")
-        except ImportError:
-            print("📦 Installing Python dependencies...")
-            subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+        except importlib.metadata.PackageNotFoundError:
+            # Install only what is missing rather than running the resolver over every requirement
+            missing = self._missing_requirements()
+            if missing:
+                print(f"📦 Installing {len(missing)} missing Python dependencies...")
+                subprocess.run([str(self.venv_pip), "install", *missing], check=True)
 
         # Check frontend dependencies
         frontend_modules = self.root_dir / "frontend" / "node_modules"
@@ -65,6 +118,20 @@ class DevRunner:
 
         return True
 
+    def _missing_requirements(self) -> List[str]:
+        """Lines of requirements.txt whose distribution is not installed"""
+
+        def normalize(name: str) -> str:
+            return re.sub(r"[-_.]+", "-", name).lower()
+
+        installed = {normalize(dist.metadata["Name"]) for dist in importlib.metadata.distributions()}
+        missing = []
+        for line in (self.root_dir / "requirements.txt").read_text().splitlines():
+            match = REQUIREMENT_NAME_RE.match(line)
+            if match and normalize(match.group(1)) not in installed:
+                missing.append(line.split(" #", 1)[0].strip())
+        return missing
+
     def start_service(
         self, name: str, cmd: List[str], cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None
     ) -> subprocess.Popen[str]:
@@ -86,64 +153,168 @@ class DevRunner:
         )
 
         self.processes.append((name, process))
+        # Drain the pipe continuously so a chatty service never blocks on a full stdout buffer
+        threading.Thread(target=self.monitor_output, args=(name, process), daemon=True).start()
         return process
 
-    def kill_process_on_port(self, port: int) -> None:
-        """Kill any process using the specified port"""
+    @staticmethod
+    def _listening_pids(ports: Tuple[int, ...]) -> Dict[int, set[int]]:
+        """Map each port to the PIDs listening on it, from one pass over the listening sockets"""
+        owners: Dict[int, set[int]] = {port: set() for port in ports}
+        try:
+            # ss only lists listening TCP sockets, so this is a handful of lines rather than every socket
+            output = subprocess.run(["ss", "-Htlnp"], capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            # No ss (e.g. macOS/Windows): fall back to a single psutil scan
+            for conn in psutil.net_connections(kind="tcp"):
+                if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port in owners and conn.pid:
+                    owners[conn.laddr.port].add(conn.pid)
+            return owners
+
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            port = fields[3].rpartition(":")[2]
+            if port.isdigit() and int(port) in owners:
+                owners[int(port)].update(int(pid) for pid in PID_RE.findall(line))
+        return owners
+
+    def kill_processes_on_ports(self, ports: Tuple[int, ...]) -> None:
+        """Kill any processes listening on the given ports, waiting up to a second before forcing them"""
         try:
-            for conn in psutil.net_connections():
-                if hasattr(conn, "laddr") and conn.laddr and conn.laddr.port == port and conn.pid:
-                    try:
-                        proc = psutil.Process(conn.pid)
-                        print(f"🔪 Killing process {proc.name()} (PID: {conn.pid}) on port {port}")
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=5)
-                        except psutil.TimeoutExpired:
-                            proc.kill()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+            owners = self._listening_pids(ports)
         except Exception as e:
-            print(f"⚠️  Could not check port {port}: {e}")
+            print(f"⚠️  Could not check ports {', '.join(map(str, ports))}: {e}")
+            return
+
+        procs = []
+        for port, pids in owners.items():
+            for pid in pids:
+                try:
+                    proc = psutil.Process(pid)
+                    print(f"🔪 Killing process {proc.name()} (PID: {pid}) on port {port}")
+                    proc.terminate()
+                    procs.append(proc)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+        _, alive = psutil.wait_procs(procs, timeout=1)
+        for proc in alive:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+    def kill_process_on_port(self, port: int) -> None:
+        """Kill any process using the specified port"""
+        self.kill_processes_on_ports((port,))
 
     def kill_existing_services(self) -> None:
         """Kill any existing services on our ports"""
         print("🧹 Cleaning up existing services...")
-
-        # Kill processes on our main ports
-        self.kill_process_on_port(8000)  # Backend
-        self.kill_process_on_port(3000)  # Frontend
-        self.kill_process_on_port(11434)  # Ollama
-
-        # Give processes time to die
-        time.sleep(1)
+        self.kill_processes_on_ports(SERVICE_PORTS)
 
     def wait_for_service(self, url: str, timeout: int = 30) -> bool:
         """Wait for a service to be ready with visual progress"""
-        start_time = time.time()
-        dots = 0
-        while time.time() - start_time < timeout:
-            try:
-                response = requests.get(url, timeout=1)
-                if response.status_code in [200, 404]:
-                    print()  # New line after dots
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        done = threading.Event()
+
+        def show_progress() -> None:
+            # Dots tick on their own fixed 200 ms schedule, independent of the probe backoff
+            dots = 0
+            while not done.wait(0.2):
+                dots = (dots + 1) % 4
+                print(f"\r{'.' * dots}   ", end='', flush=True)
+
+        spinner = threading.Thread(target=show_progress, daemon=True)
+        spinner.start()
+        try:
+            while time.monotonic() < deadline:
+                # HEAD skips the response body; any of these statuses means the server is answering
+                if self._probe(url, "HEAD", timeout=0.5) in {200, 204, 404, 405}:
                     return True
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                pass
-            
-            # Show progress dots
-            dots = (dots + 1) % 4
-            print(f"\r{'.' * dots}   ", end='', flush=True)
-            time.sleep(0.5)
-        
-        print()  # New line after dots
-        return False
 
-    async def monitor_output(self, name: str, process: subprocess.Popen[str]) -> None:
-        """Monitor and display process output"""
-        if process.stdout:
-            for line in process.stdout:
-                print(f"[{name}] {line.rstrip()}")
+                # Back off from 50 ms so a fast start is noticed quickly without hammering a slow one
+                time.sleep(delay)
+                delay = min(delay * 1.7, 0.5)
+            return False
+        finally:
+            done.set()
+            spinner.join()
+            print()  # New line after dots
+
+    @staticmethod
+    def _unit_states(*units: str) -> Dict[str, str]:
+        """States of systemd units from a single systemctl is-active call (it prints one line per unit)"""
+        try:
+            output = subprocess.run(["systemctl", "is-active", *units], capture_output=True, text=True).stdout
+        except OSError:
+            output = ""
+        states = output.split()
+        return {unit: states[i] if i < len(states) else "unknown" for i, unit in enumerate(units)}
+
+    def _probe(self, url: str, method: str = "GET", timeout: float = 2.0) -> Optional[int]:
+        """Send one plain-HTTP request to a local service; returns the status, or None if it is not answering"""
+        parts = urlsplit(url)
+        connection = self._probe_connections.get(parts.netloc)
+        if connection is None:
+            connection = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+            self._probe_connections[parts.netloc] = connection
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        try:
+            connection.request(method, parts.path or "/")
+            response = connection.getresponse()
+            response.read()  # Drain the body so the connection can be reused
+            return response.status
+        except (OSError, http.client.HTTPException):
+            # Reconnect on the next probe
+            connection.close()
+            del self._probe_connections[parts.netloc]
+            return None
+
+    def _ollama_running(self) -> bool:
+        """Check whether Ollama is answering on its default port"""
+        return self._probe("http://localhost:11434/api/tags") is not None
+
+    @staticmethod
+    def _show_banner(banner: str) -> None:
+        """Clear the screen and draw a banner in one write"""
+        if os.name == "nt":
+            # Older Windows consoles do not interpret ANSI escapes
+            os.system("cls")
+            sys.stdout.write(banner)
+        else:
+            sys.stdout.write(CLEAR + banner)
+        sys.stdout.flush()
+
+    def monitor_output(self, name: str, process: subprocess.Popen[str]) -> None:
+        """Monitor and display process output, one write per chunk read rather than one print per line"""
+        if not process.stdout:
+            return
+        fd = process.stdout.fileno()
+        prefix = f"[{name}] ".encode()
+        pending = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()  # Partial last line waits for the next chunk
+            if lines:
+                self._write_output(b"".join(prefix + line.rstrip() + b"\n" for line in lines))
+        if pending:
+            self._write_output(prefix + pending.rstrip() + b"\n")
+
+    @staticmethod
+    def _write_output(data: bytes) -> None:
+        """Write raw bytes to stdout after anything already buffered by print()"""
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
 
     def run(self) -> None:
         """Run all services"""
@@ -154,52 +325,40 @@ class DevRunner:
         self.kill_existing_services()
 
         # Clear screen for clean start
-        os.system('clear' if os.name != 'nt' else 'cls')
-        
-        print("""
-╔═══════════════════════════════════════════════════════════════════╗
-║                      SOLICITOR BRAIN v0.1.0                       ║
-║                   AI-Powered Legal Assistant                      ║
-╠═══════════════════════════════════════════════════════════════════╣
-║  🏃 Starting development environment...                           ║
-╚═══════════════════════════════════════════════════════════════════╝
-""")
+        self._show_banner(BANNER_START)
 
         # Set development environment
         os.environ["DEBUG"] = "true"
         os.environ["PYTHONPATH"] = str(self.root_dir)
 
+        # Probe PostgreSQL, Redis and Ollama at once so pre-flight costs the slowest check, not the sum
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            unit_states = pool.submit(self._unit_states, "postgresql", "redis-server")
+            ollama_up = pool.submit(self._ollama_running)
+
         # Start PostgreSQL if not running
-        pg_status = subprocess.run(["systemctl", "is-active", "postgresql"], capture_output=True, text=True)
-        if pg_status.stdout.strip() != "active":
+        if unit_states.result()["postgresql"] != "active":
             print("⚠️  PostgreSQL is not running. Start it with:")
             print("    sudo systemctl start postgresql")
             return
 
         # Start Redis if not running
-        redis_status = subprocess.run(["systemctl", "is-active", "redis-server"], capture_output=True, text=True)
-        if redis_status.stdout.strip() != "active":
+        if unit_states.result()["redis-server"] != "active":
             print("⚠️  Redis is not running. Start it with:")
             print("    sudo systemctl start redis-server")
             return
 
         # Start Ollama if not running
-        try:
-            requests.get("http://localhost:11434/api/tags", timeout=2)
-        except (requests.exceptions.RequestException, requests.exceptions.Timeout):
+        if not ollama_up.result():
             print("🤖 Starting Ollama...")
             self.start_service("Ollama", ["ollama", "serve"], env={"OLLAMA_HOST": "0.0.0.0:11434"})
             time.sleep(3)
 
         # Start backend
-        python_path = self.root_dir / ".venv" / "bin" / "python"
-        if not python_path.exists():
-            python_path = self.root_dir / ".venv" / "Scripts" / "python.exe"  # Windows
-
         self.start_service(
             "Backend",
             [
-                str(python_path),
+                str(self.venv_python),
                 "-m",
                 "uvicorn",
                 "backend.main:app",
@@ -232,50 +391,34 @@ class DevRunner:
         print("✅ Frontend ready")
 
         # Clear screen and show success
-        os.system('clear' if os.name != 'nt' else 'cls')
-        
-        print("""
-╔═══════════════════════════════════════════════════════════════════╗
-║               🎉 SOLICITOR BRAIN IS RUNNING! 🎉                  ║
-╠═══════════════════════════════════════════════════════════════════╣
-║                                                                   ║
-║  📍 Access Points:                                                ║
-║  ├─ Frontend:     http://localhost:3000                          ║
-║  ├─ Backend API:  http://localhost:8000                          ║
-║  └─ API Docs:     http://localhost:8000/docs                     ║
-║                                                                   ║
-║  🔑 Development Credentials:                                      ║
-║  ├─ Email:    test@example.com                                   ║
-║  └─ Password: test                                               ║
-║                                                                   ║
-║  🛠️  VS Code Debugging:                                           ║
-║  1. Open VS Code: code .                                         ║
-║  2. Go to Run and Debug (Ctrl+Shift+D)                          ║
-║  3. Select 'Full Stack' and press F5                            ║
-║                                                                   ║
-╠═══════════════════════════════════════════════════════════════════╣
-║  ⚠️  AI outputs are organisational assistance only –              ║
-║     verify before use.                                           ║
-╚═══════════════════════════════════════════════════════════════════╝
-""")
+        self._show_banner(BANNER_READY)
         
         # Automatically open browser
-        print("\n🌐 Opening browser...")
-        time.sleep(2)  # Give frontend a moment to fully start
-        webbrowser.open("http://localhost:3000")
+        # wait_for_service has already seen the frontend answer, so there is no need to pause before opening it
+        if self._browser is not None:
+            print("\n🌐 Opening browser...")
+            self._browser.open_new_tab("http://localhost:3000")
         
         print("\nPress Ctrl+C to stop all services...")
 
-        # Wait for interrupt
+        # Wait for interrupt, sleeping until SIGCHLD reports a child exit (Windows has no SIGCHLD, so poll there)
+        child_exited = threading.Event()
+        recheck = None
+        if hasattr(signal, "SIGCHLD"):
+            signal.signal(signal.SIGCHLD, lambda signum, frame: child_exited.set())
+        else:
+            recheck = 1.0
         try:
             while True:
-                time.sleep(1)
+                # Clear before checking so an exit between the check and the wait still wakes us
+                child_exited.clear()
                 # Check if any process has died
                 for name, process in self.processes:
                     if process.poll() is not None:
                         print(f"\n❌ {name} has stopped unexpectedly!")
                         self.cleanup()
                         return
+                child_exited.wait(recheck)
         except KeyboardInterrupt:
             print("\n\n🛑 Shutting down...")
             self.cleanup()
@@ -12,7 +12,7 @@ if [ "$NODE_ENV" = "development" ]; then
     # Start backend in background
     source venv/bin/activate
     cd backend
-    uvicorn main:app --reload --host 0.0.0.0 --port 8000 &
+    uvicorn main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop &
     BACKEND_PID=$!
     cd ..
     
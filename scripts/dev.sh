@@ -133,7 +133,7 @@ start_services() {
     # Start backend
     echo -e "${CYAN}Starting backend on http://localhost:8000${NC}"
     cd "$PROJECT_ROOT"
-    uvicorn backend.main:app --reload --host 0.0.0.0 --port 8000 > logs/backend.log 2>&1 &
+    uvicorn backend.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop > logs/backend.log 2>&1 &
     BACKEND_PID=$!
     
     # Start frontend
@@ -4,32 +4,66 @@ Quick fact entry tool for Solicitor Brain
 Allows rapid fact entry from command line
 """
 
+import asyncio
+import json
+from collections import defaultdict
+
 import click
 import httpx
 from typing import Optional, Dict, Any, List
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+
+# Concurrent POSTs used by add-bulk; requests beyond this wait for a free slot
+BULK_CONCURRENCY = 20
+
+
+def _fact_payload(
+    fact_text: str, fact_type: str, importance: str = "medium", category: Optional[str] = None
+) -> Dict[str, Any]:
+    """Request body for a manually entered fact"""
+    return {
+        "fact_text": fact_text,
+        "fact_type": fact_type,
+        "importance": importance,
+        "category": category,
+        "extracted_by_ai": False,  # Manual entry
+        "tags": [],
+    }
+
 
 class FactClient:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = DEFAULT_BASE_URL):
         self.base_url = base_url
         self.headers: Dict[str, str] = {}
+        # One pooled client, so consecutive calls reuse the kept-alive connection
+        self.client = httpx.Client(base_url=base_url, headers=self.headers, timeout=5.0)
+
+    def __enter__(self) -> "FactClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.client.close()
 
     def save_fact(
         self, case_id: str, fact_text: str, fact_type: str, importance: str = "medium", category: Optional[str] = None
     ) -> Dict[str, Any]:
         """Save a fact to a case"""
-        endpoint = f"{self.base_url}/api/cases/{case_id}/facts"
-
-        data: Dict[str, Any] = {
-            "fact_text": fact_text,
-            "fact_type": fact_type,
-            "importance": importance,
-            "category": category,
-            "extracted_by_ai": False,  # Manual entry
-            "tags": [],
-        }
-
-        response = httpx.post(endpoint, json=data, headers=self.headers)
+        data = _fact_payload(fact_text, fact_type, importance, category)
+        response = self.client.post(f"/api/cases/{case_id}/facts", json=data)
         response.raise_for_status()
         return response.json()
 
@@ -61,24 +95,56 @@ def cli():
 @click.option("--category", "-c", help="Category for the fact")
 def add(case_id: str, fact_text: str, fact_type: str, importance: str, category: Optional[str]):
     """Add a new fact to a case"""
-    client = FactClient()
-
     try:
-        result = client.save_fact(case_id, fact_text, fact_type, importance, category)
+        with FactClient() as client:
+            result = client.save_fact(case_id, fact_text, fact_type, importance, category)
         click.echo(f"✓ Fact saved with ID: {result['id']}")
     except httpx.HTTPError as e:
         click.echo(f"✗ Error saving fact: {e}", err=True)
 
 
+async def _post_facts(base_url: str, case_id: str, rows: List[Dict[str, Any]]) -> List[Any]:
+    """POST facts concurrently over one pooled client; returns each saved fact or the error it raised"""
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    limits = httpx.Limits(max_connections=BULK_CONCURRENCY)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=5.0, limits=limits) as client:
+
+        async def post_one(row: Dict[str, Any]) -> Any:
+            payload = _fact_payload(
+                row["fact_text"], row.get("fact_type", "general"), row.get("importance", "medium"), row.get("category")
+            )
+            async with semaphore:
+                response = await client.post(f"/api/cases/{case_id}/facts", json=payload)
+            response.raise_for_status()
+            return _json(response)
+
+        return await asyncio.gather(*(post_one(row) for row in rows), return_exceptions=True)
+
+
+@cli.command("add-bulk")
+@click.argument("case_id")
+@click.argument("facts_file", type=click.File("r"))
+def add_bulk(case_id: str, facts_file: Any):
+    """Add facts from a JSONL file (one {"fact_text", "fact_type", "importance", "category"} object per line)"""
+    rows = [json.loads(line) for line in facts_file if line.strip()]
+    if not rows:
+        click.echo("No facts to add.")
+        return
+
+    results = asyncio.run(_post_facts(DEFAULT_BASE_URL, case_id, rows))
+    failures = [(number, result) for number, result in enumerate(results, 1) if isinstance(result, Exception)]
+    for number, error in failures:
+        click.echo(f"✗ Fact {number}: {error}", err=True)
+    click.echo(f"✓ Saved {len(results) - len(failures)} of {len(rows)} facts")
+
+
 @cli.command()
 @click.argument("case_id")
 @click.option("--type", "-t", "fact_type", help="Filter by fact type")
 @click.option("--importance", "-i", help="Filter by importance")
 def list(case_id: str, fact_type: Optional[str], importance: Optional[str]):
     """List facts for a case"""
-    client = FactClient()
-    endpoint = f"{client.base_url}/api/cases/{case_id}/facts"
-
     params: Dict[str, str] = {}
     if fact_type:
         params["fact_type"] = fact_type
@@ -86,21 +152,19 @@ def list(case_id: str, fact_type: Optional[str], importance: Optional[str]):
         params["importance"] = importance
 
     try:
-        response = httpx.get(endpoint, params=params, headers=client.headers)
+        with FactClient() as client:
+            response = client.client.get(f"/api/cases/{case_id}/facts", params=params)
         response.raise_for_status()
-        facts = response.json()
+        facts = _json(response)
 
         if not facts:
             click.echo("No facts found.")
             return
 
         # Group by type
-        by_type: Dict[str, List[Dict[str, Any]]] = {}
+        by_type: defaultdict[str, List[Dict[str, Any]]] = defaultdict(list)
         for fact in facts:
-            fact_type_str = fact.get("fact_type", "general")
-            if fact_type_str not in by_type:
-                by_type[fact_type_str] = []
-            by_type[fact_type_str].append(fact)
+            by_type[fact.get("fact_type", "general")].append(fact)
 
         # Display
         for fact_type_key, type_facts in by_type.items():
@@ -124,11 +188,9 @@ def list(case_id: str, fact_type: Optional[str], importance: Optional[str]):
 @cli.command()
 def cases():
     """List all cases"""
-    client = FactClient()
-    endpoint = f"{client.base_url}/api/cases"
-
     try:
-        response = httpx.get(endpoint, headers=client.headers)
+        with FactClient() as client:
+            response = client.client.get("/api/cases")
         response.raise_for_status()
         cases = response.json()
 
@@ -5,7 +5,8 @@ Run the backend with error reporting enabled for VS Code
 
 import sys
 import os
-import subprocess
+
+import uvicorn
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -13,13 +14,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 # Import bug reporter to ensure it's initialized
 from backend.utils.bug_reporter import bug_reporter  # noqa: F401
 
-# Run uvicorn with error reporting enabled
+# Run uvicorn in this process, so the bug reporter above stays attached
 if __name__ == "__main__":
-    subprocess.run([
-        sys.executable, "-m", "uvicorn",
+    uvicorn.run(
         "backend.main:app",
-        "--host", "0.0.0.0",
-        "--port", "8000",
-        "--reload",
-        "--log-level", "info"
-    ])
\ No newline at end of file
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        log_level="info"
+    )
\ No newline at end of file
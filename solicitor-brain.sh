@@ -304,7 +304,7 @@ start_services() {
         log_info "Starting Backend API..."
         cd "$PROJECT_ROOT"
         source "$VENV_DIR/bin/activate"
-        nohup uvicorn backend.main:app --host 127.0.0.1 --port 8000 --reload > "$LOGS_DIR/backend.log" 2>&1 &
+        nohup uvicorn backend.main:app --host 127.0.0.1 --port 8000 --loop uvloop --reload > "$LOGS_DIR/backend.log" 2>&1 &
         echo $! > "$BACKEND_PID"
     fi
     
@@ -78,7 +78,7 @@ wait_for_service() {
 # Start backend
 echo -e "${BLUE}Starting Backend API...${NC}"
 cd backend
-uvicorn main:app --host 0.0.0.0 --port 8000 --reload > ../logs/backend.log 2>&1 &
+uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --reload > ../logs/backend.log 2>&1 &
 BACKEND_PID=$!
 cd ..
 
@@ -0,0 +1,51 @@
+"""Tests for the row buffering behind bulk_insert_context."""
+
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from sqlalchemy import Column, DateTime, Integer, String, func  # noqa: E402
+from sqlalchemy.orm import declarative_base  # noqa: E402
+
+from backend.utils.db_context import _as_record, _client_defaults, _record_keys  # noqa: E402
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    ref = Column(String, default=lambda: uuid.uuid4().hex)
+    kind = Column(String, default="general")
+    note = Column(String)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+def _records(items):
+    table = Item.__table__
+    keys = _record_keys(table, None, items[0])
+    defaults = _client_defaults(table, keys)
+    return keys, [dict(zip(keys, _as_record(item, keys, defaults))) for item in items]
+
+
+def test_columns_unset_on_first_model_are_kept_for_later_rows():
+    keys, rows = _records([Item(note=None), Item(note="set later")])
+    assert "note" in keys
+    assert rows[1]["note"] == "set later"
+
+
+def test_generated_columns_are_left_to_the_database():
+    keys, _ = _records([Item(note="x")])
+    assert "id" not in keys
+    assert "created_at" not in keys
+
+
+def test_client_defaults_fill_unset_values():
+    keys, rows = _records([Item(note="a"), {"note": "b"}, Item(note="c", kind="claim")])
+    assert all(row["ref"] for row in rows)
+    assert rows[0]["ref"] != rows[1]["ref"]
+    assert [row["kind"] for row in rows] == ["general", "general", "claim"]
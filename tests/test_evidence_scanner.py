@@ -0,0 +1,22 @@
+"""Tests for EvidenceScanner's evidence classification."""
+
+import pytest
+
+pytest.importorskip("docx")
+pytest.importorskip("fitz")
+pytest.importorskip("pytesseract")
+pytest.importorskip("PIL")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("backend.models.document")
+
+from backend.services.evidence_scanner import EvidenceScanner, EvidenceType  # noqa: E402
+
+
+@pytest.mark.parametrize("text", ["", "the quick brown fox jumps over the lazy dog"])
+def test_classify_falls_back_to_business_record_when_nothing_scores(text):
+    assert EvidenceScanner()._classify_evidence(text, "unknown") == EvidenceType.BUSINESS_RECORD
+
+
+def test_classify_picks_the_matching_type():
+    text = "this agreement is made between the parties"
+    assert EvidenceScanner()._classify_evidence(text, "unknown") == EvidenceType.CONTRACT
@@ -0,0 +1,111 @@
+"""Tests for FactService date extraction and conflict detection."""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("backend.models.case_facts")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from backend.models.case_facts import CaseFact  # noqa: E402
+from backend.services.fact_service import FactService  # noqa: E402
+
+START = datetime(2024, 1, 1, 9, 0)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Signed on 5 March 2023", datetime(2023, 3, 5)),
+        ("hearing listed for 14  july 2024", datetime(2024, 7, 14)),
+        ("Served 05-03-2023 by post", datetime(2023, 3, 5)),
+        ("Served 5/3/2023", datetime(2023, 3, 5)),
+        ("12/1/2024, then 3 May 2020", datetime(2024, 1, 12)),
+    ],
+)
+def test_extract_date(text, expected):
+    assert FactService(None)._extract_date(text) == expected
+
+
+@pytest.mark.parametrize("text", ["31/02/2023", "30 February 2023", "no date here"])
+def test_extract_date_rejects_invalid_or_missing_dates(text):
+    assert FactService(None)._extract_date(text) is None
+
+
+def _fact(case_id, minute, fact_type, fact_text, category=None, fact_date=None, sign_off_status="pending"):
+    created = START + timedelta(minutes=minute)
+    return CaseFact(
+        id=uuid4(),
+        case_id=case_id,
+        fact_type=fact_type,
+        fact_text=fact_text,
+        category=category,
+        fact_date=fact_date,
+        importance="medium",
+        verification_status="verified",
+        sign_off_status=sign_off_status,
+        extracted_by_ai=False,
+        confidence_score=0.0,
+        created_at=created,
+        updated_at=created,
+    )
+
+
+async def _conflicts(facts):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: CaseFact.metadata.create_all(sync_conn, tables=[CaseFact.__table__]))
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            session.add_all(facts)
+            await session.commit()
+            service = FactService(session)
+            case_id = facts[0].case_id
+            found = await service.find_conflicting_facts(case_id)
+
+            # The pairwise check over get_case_facts is the reference the self-join must match
+            listed = await service.get_case_facts(case_id)
+            expected = [
+                (fact1, fact2)
+                for i, fact1 in enumerate(listed)
+                for fact2 in listed[i + 1:]
+                if service._keys_conflict(service._conflict_key(fact1), service._conflict_key(fact2))
+            ]
+            return [(a.fact_text, b.fact_text) for a, b in found], [(a.fact_text, b.fact_text) for a, b in expected]
+    finally:
+        await engine.dispose()
+
+
+def test_conflicts_follow_case_fact_order():
+    case_id = uuid4()
+    facts = [
+        _fact(case_id, 0, "date", "Signed 1 March 2023 (copy)", fact_date=datetime(2023, 3, 1)),
+        _fact(case_id, 1, "date", "Signed 1 March 2023", fact_date=datetime(2023, 3, 1)),
+        _fact(case_id, 2, "date", "Signed 2 March 2023", fact_date=datetime(2023, 3, 2)),
+        _fact(case_id, 3, "date", "Hearing 1 March 2023", category="hearing", fact_date=datetime(2023, 3, 1)),
+        _fact(
+            case_id, 4, "date", "Hearing 9 March 2023", category="hearing", fact_date=datetime(2023, 3, 9),
+            sign_off_status="rejected",
+        ),
+        _fact(case_id, 5, "date", "Signed some time in March"),
+        _fact(case_id, 6, "party", "Alice", category="claimant"),
+        _fact(case_id, 7, "party", "Bob", category="claimant"),
+        _fact(case_id, 8, "party", "Alice", category="claimant"),
+        _fact(case_id, 9, "party", "Carol"),
+    ]
+
+    found, expected = asyncio.run(_conflicts(facts))
+
+    assert found == expected
+    assert found == [
+        ("Alice", "Bob"),
+        ("Bob", "Alice"),
+        ("Signed 2 March 2023", "Signed 1 March 2023"),
+        ("Signed 2 March 2023", "Signed 1 March 2023 (copy)"),
+    ]
@@ -0,0 +1,38 @@
+"""Tests for the OCR service's pure image and layout helpers."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("fitz")
+pytest.importorskip("pytesseract")
+pytest.importorskip("PIL")
+pytest.importorskip("pydantic_settings")
+
+from backend.services.ocr_service import _find_block_spans, _otsu_threshold  # noqa: E402
+
+
+def test_otsu_threshold_matches_opencv():
+    rng = np.random.default_rng(0)
+    # Dark text on a light page: two well separated intensity clusters
+    gray = np.where(rng.random((120, 160)) < 0.2, rng.integers(20, 90, (120, 160)), rng.integers(170, 240, (120, 160)))
+    gray = gray.astype(np.uint8)
+
+    _, expected = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    np.testing.assert_array_equal(_otsu_threshold(gray), expected)
+
+
+def test_block_spans_split_on_unrecognised_words():
+    data = {
+        'conf': ['-1', '96', '90.5', '-1', '-1', '88', '95', '92', '0', '91'],
+        'text': ['', 'Hello', 'world', '', '', 'Second', ' ', 'block', '', 'Third'],
+    }
+
+    spans = _find_block_spans(data)
+
+    assert [span.tolist() for span in spans] == [[1, 2], [5, 7], [9]]
+
+
+def test_block_spans_without_recognised_words():
+    assert _find_block_spans({'conf': ['-1', '', None], 'text': ['', 'noise', '']}) == []
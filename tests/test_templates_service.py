@@ -0,0 +1,24 @@
+"""Tests for the templates service bootstrap and bytecode cache."""
+
+import asyncio
+import shutil
+
+import pytest
+
+pytest.importorskip("jinja2")
+pytest.importorskip("pydantic_settings")
+
+from backend.services.templates_service import BOOTSTRAP_SENTINEL, TemplatesService  # noqa: E402
+
+
+def test_render_after_bytecode_cache_wiped(tmp_path, monkeypatch):
+    """A wiped .jinja_cache with the sentinel still present must not break rendering."""
+    monkeypatch.chdir(tmp_path)
+    TemplatesService()
+    assert (tmp_path / "templates" / BOOTSTRAP_SENTINEL).exists()
+
+    shutil.rmtree(tmp_path / "templates" / ".jinja_cache")
+
+    service = TemplatesService()
+    html = asyncio.run(service.render_template("letters/client_engagement.html", {"client_name": "A Client"}))
+    assert "Solicitor &amp; Associates" in html or "Solicitor & Associates" in html